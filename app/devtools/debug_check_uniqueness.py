@@ -23,10 +23,7 @@ def build_puzzle_from_generated(gp):
     for r, c in gp.blocked_cells:
         grid.get_cell(Position(r, c)).blocked = True
     
-    for r, c, v in gp.givens:
-        cell = grid.get_cell(Position(r, c))
-        cell.value = v
-        cell.given = True
+    grid.set_givens(gp.givens)
     
     constraints = Constraints(
         min_value=1,
@@ -9,10 +9,64 @@ if ROOT_DIR not in sys.path:
 # Optional: register custom markers to avoid warnings
 import pytest  # type: ignore
 
+# Expensive tests scheduled first within their module so the long tail starts
+# early, without splitting a module apart and re-running its module fixtures
+EXPENSIVE_ID_KEYWORDS = (
+    "test_real_generation",
+    "test_generator_determinism",
+    "test_random_walk_v2_completes",
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="run tests marked slow (skipped by default)",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_cmdline_main(config):
+    """With pytest-xdist installed and no -n given, run across all cores.
+
+    --dist=loadfile keeps each test file on one worker so module-level caches
+    (solution-count memo, puzzle templates) stay warm within the file.
+    Workers re-run this hook, so they are left alone.
+    """
+    if os.environ.get("PYTEST_XDIST_WORKER") or not config.pluginmanager.hasplugin("xdist"):
+        return None
+    if config.getoption("numprocesses", None) is None and config.getoption("dist", "no") == "no":
+        config.option.numprocesses = "auto"
+        config.option.dist = "loadfile"
+    return None
+
+
 def pytest_configure(config):
     config.addinivalue_line("markers", "slow: marks tests as slow")
 
 
+def pytest_collection_modifyitems(config, items):
+    # Slow tests are reported as skipped (never deselected) unless --runslow
+    skip_slow = None if config.getoption("--runslow") else pytest.mark.skip(
+        reason="slow; pass --runslow to run"
+    )
+    for item in items:
+        if skip_slow is not None and item.get_closest_marker("slow") is not None:
+            item.add_marker(skip_slow)
+    # Stable sort keyed on module position first, so modules stay contiguous
+    # and only the order inside each module changes
+    module_order = {}
+    for item in items:
+        module_order.setdefault(item.nodeid.split("::", 1)[0], len(module_order))
+    items.sort(key=lambda item: (
+        module_order[item.nodeid.split("::", 1)[0]],
+        0 if (
+            item.get_closest_marker("slow") is not None
+            or any(key in item.nodeid for key in EXPENSIVE_ID_KEYWORDS)
+        ) else 1,
+    ))
+
+
 def pytest_ignore_collect(collection_path, config):  # type: ignore[no-redef]
     """Exclude auxiliary scripts and archives from collection.
 
@@ -3,6 +3,11 @@
 Contains the Adjacency class for adjacency relations in the puzzle.
 """
 
+# Neighbour deltas, 4-neighbours first then diagonals, built once at import
+DIRECTIONS_4 = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIRECTIONS_8 = DIRECTIONS_4 + ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
 class Adjacency:
     """Centralizes adjacency rules so switching 4/8-neighbors is trivial.
     Contains fields: allow_diagonal: bool = True"""
@@ -10,11 +15,8 @@ class Adjacency:
         self.allow_diagonal = allow_diagonal
     def get_neighbors(self, position):
         """Returns a list of neighboring positions based on adjacency rules."""
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)] # 4-neighbors
-        if self.allow_diagonal:
-            directions += [(-1, -1), (-1, 1), (1, -1), (1, 1)] # add diagonals
-        neighbors = []
-        for dr, dc in directions:
-            neighbors.append((position.row + dr, position.col + dc))
+        directions = DIRECTIONS_8 if self.allow_diagonal else DIRECTIONS_4
+        row, col = position.row, position.col
+        neighbors = [(row + dr, col + dc) for dr, dc in directions]
         return neighbors
 
@@ -11,11 +11,22 @@ class Cell:
     value: Optional[int]
     blocked: bool = False
     given: bool = False."""
+    __slots__ = ('pos', 'value', 'blocked', 'given')
+
     def __init__(self, pos=Position, value=None, blocked=False, given=False):
         self.pos = pos # Position object
         self.value = value # None if empty, else an integer value
         self.blocked = blocked # True if the cell is blocked (not usable)
         self.given = given # True if the cell's value is a given clue
+    @classmethod
+    def _fast(cls, pos, value, blocked, given):
+        """Construct a cell without default-argument handling (bulk builders)."""
+        obj = cls.__new__(cls)
+        obj.pos = pos
+        obj.value = value
+        obj.blocked = blocked
+        obj.given = given
+        return obj
     def is_empty(self):
         return self.value is None and not self.blocked
     def is_filled(self):
@@ -4,7 +4,7 @@ Contains the Grid class representing the puzzle grid.
 """
 from core.position import Position
 from core.cell import Cell
-from core.adjacency import Adjacency
+from core.adjacency import Adjacency, DIRECTIONS_4, DIRECTIONS_8
 
 class Grid:
     """A grid is a basic board container. Fields:
@@ -24,6 +24,11 @@ class Grid:
             # Create empty cells
             self.cells = [[Cell(Position(r, c)) for c in range(cols)] for r in range(rows)]
         self.adjacency = Adjacency(allow_diagonal=allow_diagonal)
+    def clone(self) -> "Grid":
+        """Returns an independent copy of this grid (cell state copied, Positions shared)."""
+        fast = Cell._fast
+        cells = [[fast(c.pos, c.value, c.blocked, c.given) for c in row] for row in self.cells]
+        return Grid(self.rows, self.cols, cells, allow_diagonal=self.adjacency.allow_diagonal)
     def get_cell(self, pos: Position) -> Cell:
         """Returns the cell at the given position."""
         if 0 <= pos.row < self.rows and 0 <= pos.col < self.cols:
@@ -44,6 +49,36 @@ class Grid:
             cell.value = None
         else:
             raise ValueError("Cannot clear a given cell.")
+    def set_values(self, triples):
+        """Sets the value of every (row, col, value) in triples, with set_cell_value's rules."""
+        cells = self.cells
+        for r, c, v in triples:
+            if 0 <= r < self.rows and 0 <= c < self.cols:
+                cell = cells[r][c]
+                if not cell.given and not cell.blocked:
+                    cell.value = v
+                else:
+                    raise ValueError("Cannot set value of a blocked cell.")
+            else:
+                raise IndexError("Position out of grid bounds.")
+    def set_blocked_cells(self, coords):
+        """Marks every (row, col) in coords as blocked."""
+        cells = self.cells
+        for r, c in coords:
+            if 0 <= r < self.rows and 0 <= c < self.cols:
+                cells[r][c].blocked = True
+            else:
+                raise IndexError("Position out of grid bounds.")
+    def set_givens(self, triples):
+        """Places every (row, col, value) in triples as a given."""
+        cells = self.cells
+        for r, c, v in triples:
+            if 0 <= r < self.rows and 0 <= c < self.cols:
+                cell = cells[r][c]
+                cell.value = v
+                cell.given = True
+            else:
+                raise IndexError("Position out of grid bounds.")
     def iter_cells(self):
         """Yields every Cell in the grid, 
         in row-major order (top to bottom, left to right)."""
@@ -72,14 +107,17 @@ class Grid:
     def neighbors_of(self, pos: Position):
         """Returns a list of neighboring positions based on the grid's adjacency rules.
         Blocked cells are excluded from neighbors."""
-        # Utilize the Adjacency class to get raw neighbors
-        raw_neighbors = self.adjacency.get_neighbors(pos)
-        # Filter neighbors to ensure they are within grid bounds and not blocked
+        # Same neighbour order as Adjacency.get_neighbors, but indexing the cell
+        # rows directly and handing back each cell's own Position
+        directions = DIRECTIONS_8 if self.adjacency.allow_diagonal else DIRECTIONS_4
+        rows, cols, cells = self.rows, self.cols, self.cells
+        row, col = pos.row, pos.col
         valid_neighbors = []
-        for r, c in raw_neighbors:
-            if 0 <= r < self.rows and 0 <= c < self.cols:
-                neighbor_pos = Position(r, c)
+        for dr, dc in directions:
+            r, c = row + dr, col + dc
+            if 0 <= r < rows and 0 <= c < cols:
+                cell = cells[r][c]
                 # Skip blocked cells
-                if not self.get_cell(neighbor_pos).blocked:
-                    valid_neighbors.append(neighbor_pos)
+                if not cell.blocked:
+                    valid_neighbors.append(cell.pos)
         return valid_neighbors
\ No newline at end of file
@@ -67,7 +67,7 @@ def generate_with_timing(size, difficulty, path_mode, seed):
     print('='*80)
     
     # Track generation time
-    gen_start = time.time()
+    gen_start = time.perf_counter_ns()
     result = Generator.generate_puzzle(
         size=size,
         difficulty=difficulty,
@@ -77,7 +77,7 @@ def generate_with_timing(size, difficulty, path_mode, seed):
         timeout_ms=30000,
         max_attempts=10
     )
-    gen_elapsed = (time.time() - gen_start) * 1000
+    gen_elapsed = (time.perf_counter_ns() - gen_start) / 1_000_000
     
     if result is None:
         print("[FAILED] Generation failed!")
@@ -67,7 +67,7 @@ def check_with_new_method(puzzle):
     result = check_uniqueness(request)
     elapsed = (time.time() - start) * 1000
     
-    total_nodes = sum(result.nodes_explored.values())
+    total_nodes = result.total_nodes
     
     return {
         'decision': result.decision,
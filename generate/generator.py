@@ -29,10 +29,7 @@ def show_current_puzzle(puzzle_size,cells):
         grid=puzzle.Grid(puzzle_size, puzzle_size),
         constraints=puzzle.Constraints(1, puzzle_size * puzzle_size)
     )
-    for (r, c, v) in cells:
-        cell = temp_puzzle.grid.get_cell(puzzle.Position(r, c))
-        cell.value = v
-        cell.given = True
+    temp_puzzle.grid.set_givens(cells)
 
     ascii_print(temp_puzzle)
 
@@ -162,10 +159,7 @@ class Generator:
         
         # Mark blocked cells BEFORE building path (original + mask)
         all_blocked = list(config.blocked) + mask_cells
-        for r, c in all_blocked:
-            pos = Position(r, c)
-            cell = grid.get_cell(pos)
-            cell.blocked = True
+        grid.set_blocked_cells(all_blocked)
         
         # Build path (T032: now returns PathBuildResult) with all blocked cells
         path_result = PathBuilder.build(grid, mode=path_mode, rng=rng, blocked=all_blocked)
@@ -181,9 +175,7 @@ class Generator:
             if path_mode != 'random_walk_v2' and mask_cells:
                 print(f"         Falling back to random_walk_v2 mode", file=sys.stderr)
                 grid = Grid(size, size, allow_diagonal=allow_diagonal)
-                for r, c in all_blocked:
-                    pos = Position(r, c)
-                    grid.get_cell(pos).blocked = True
+                grid.set_blocked_cells(all_blocked)
                 path_result = PathBuilder.build(grid, mode='random_walk_v2', rng=rng, blocked=all_blocked)
                 path = path_result.positions
                 path_build_ms = path_result.metrics.get("path_build_ms", 0)
@@ -209,9 +201,7 @@ class Generator:
                 remainder_cells = all_cells - path_cells
                 
                 # Block remainder
-                for r, c in remainder_cells:
-                    pos = Position(r, c)
-                    grid.get_cell(pos).blocked = True
+                grid.set_blocked_cells(remainder_cells)
                 
                 import sys
                 print(f"INFO: Accepted partial path with {path_result.coverage:.1%} coverage", file=sys.stderr)
@@ -223,9 +213,7 @@ class Generator:
                 print(f"         Falling back to serpentine mode", file=sys.stderr)
                 # Rebuild with serpentine
                 grid = Grid(size, size, allow_diagonal=allow_diagonal)
-                for r, c in all_blocked:
-                    pos = Position(r, c)
-                    grid.get_cell(pos).blocked = True
+                grid.set_blocked_cells(all_blocked)
                 path_result = PathBuilder.build(grid, mode="serpentine", rng=rng, blocked=all_blocked)
                 path = path_result.positions
         
@@ -20,17 +20,15 @@ class StructuralInputs:
     solver_metrics: dict
 
 
+# Quadrant names indexed by (bottom << 1) | right
+_QUADRANT_KEYS = ("top_left", "top_right", "bottom_left", "bottom_right")
+
+
 def _compute_givens_distribution(size: int, givens: Sequence[Tuple[int, int, int]]) -> dict:
     """Calculate row/column/quadrant clue distributions."""
     row_counts = [0] * size
     col_counts = [0] * size
-    quadrant_counts = {
-        "top_left": 0,
-        "top_right": 0,
-        "bottom_left": 0,
-        "bottom_right": 0,
-    }
-    half = size / 2
+    quadrant_counts = [0, 0, 0, 0]
 
     for row, col, _ in givens:
         if 0 <= row < size:
@@ -38,15 +36,14 @@ def _compute_givens_distribution(size: int, givens: Sequence[Tuple[int, int, int
         if 0 <= col < size:
             col_counts[col] += 1
 
-        quadrant_row = "top" if row < half else "bottom"
-        quadrant_col = "left" if col < half else "right"
-        quadrant_key = f"{quadrant_row}_{quadrant_col}"
-        quadrant_counts[quadrant_key] += 1
+        # row >= size / 2 without the float division; the middle row/column of
+        # an odd grid stays on the top/left side
+        quadrant_counts[((2 * row >= size) << 1) | (2 * col >= size)] += 1
 
     return {
         "row_counts": row_counts,
         "column_counts": col_counts,
-        "quadrants": quadrant_counts,
+        "quadrants": dict(zip(_QUADRANT_KEYS, quadrant_counts)),
     }
 
 
@@ -62,13 +59,12 @@ def _compute_anchor_spacing(
             "gaps": {"min": None, "max": None, "avg": None},
         }
 
-    path_lookup = {(pos.row, pos.col): idx for idx, pos in enumerate(path)}
-    anchor_indices: List[int] = []
-    for row, col in anchor_positions:
-        if (row, col) in path_lookup:
-            anchor_indices.append(path_lookup[(row, col)])
-
-    anchor_indices = sorted(set(anchor_indices))
+    # One scan of the (self-avoiding) path against the anchor set yields the
+    # anchor indices already sorted and de-duplicated
+    anchor_set = set(anchor_positions)
+    anchor_indices: List[int] = [
+        idx for idx, pos in enumerate(path) if (pos.row, pos.col) in anchor_set
+    ]
     if not anchor_indices:
         return {
             "count": 0,
@@ -76,10 +72,7 @@ def _compute_anchor_spacing(
             "gaps": {"min": None, "max": None, "avg": None},
         }
 
-    gaps = [
-        anchor_indices[i + 1] - anchor_indices[i]
-        for i in range(len(anchor_indices) - 1)
-    ]
+    gaps = [nxt - cur for cur, nxt in zip(anchor_indices, anchor_indices[1:])]
 
     density = len(anchor_indices) / max(len(path), 1)
     gap_stats = {
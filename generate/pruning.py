@@ -2,10 +2,12 @@
 
 Interval reduction and frequency-based uniqueness repair for minimal clue counts.
 """
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 from random import random
 from typing import Optional, TYPE_CHECKING
-from enum import Enum
+from enum import IntEnum
 
 from core.position import Position
 from core.puzzle import Puzzle
@@ -15,12 +17,17 @@ if TYPE_CHECKING:
     from generate.models import GenerationConfig
 
 
-class PruningStatus(Enum):
+class PruningStatus(IntEnum):
     """Pruning outcome classification."""
-    SUCCESS = "success"
-    SUCCESS_WITH_REPAIRS = "success_with_repairs"
-    ABORTED_MAX_REPAIRS = "aborted_max_repairs"
-    ABORTED_TIMEOUT = "aborted_timeout"
+    SUCCESS = 1
+    SUCCESS_WITH_REPAIRS = 2
+    ABORTED_MAX_REPAIRS = 3
+    ABORTED_TIMEOUT = 4
+    
+    @property
+    def label(self) -> str:
+        """Lowercase name used when serializing metrics (e.g. "success")."""
+        return self.name.lower()
 
 
 @dataclass
@@ -65,8 +72,19 @@ class PruningSession:
     uniqueness_failures: int = 0
     repairs_used: int = 0
     interval_contractions: int = 0
-    history: list[IntervalState] = field(default_factory=list)
     timeout_occurred: bool = False
+    # Contraction history stored column-wise; see the history property
+    _history_low: array = field(default_factory=lambda: array('i'), repr=False)
+    _history_high: array = field(default_factory=lambda: array('i'), repr=False)
+    _history_reasons: list[Optional[str]] = field(default_factory=list, repr=False)
+    
+    @property
+    def history(self) -> list[IntervalState]:
+        """Recorded interval states, rebuilt on demand from the stored columns."""
+        return [
+            IntervalState(low, high, reason)
+            for low, high, reason in zip(self._history_low, self._history_high, self._history_reasons)
+        ]
     
     def record_iteration(self):
         """Increment iteration counter."""
@@ -82,7 +100,9 @@ class PruningSession:
     
     def record_interval_contraction(self, state: IntervalState):
         """Record interval state and increment contraction counter."""
-        self.history.append(state)
+        self._history_low.append(state.low_index)
+        self._history_high.append(state.high_index)
+        self._history_reasons.append(state.contraction_reason)
         self.interval_contractions += 1
     
     def record_timeout(self):
@@ -113,7 +133,7 @@ class PruningResult:
     def to_dict(self) -> dict:
         """Export as dict."""
         return {
-            "status": self.status.value,
+            "status": self.status.label,
             "final_clue_count": self.final_clue_count,
             "final_density": self.final_density,
             "time_ms": self.time_ms,
@@ -276,31 +296,33 @@ def _find_given_clusters(puzzle: Puzzle, allow_diagonal: bool = True) -> list[li
     deltas = neighbors8 if allow_diagonal else neighbors4
 
     rows, cols = puzzle.grid.rows, puzzle.grid.cols
-    visited = set()
-    clusters: list[list[Position]] = []
+    cells = puzzle.grid.cells
+    # Unblocked givens rasterized once into a flat row-major mask; each cell
+    # is cleared when visited, so the mask doubles as the visited set
+    pending = bytearray(rows * cols)
+    for r, row in enumerate(cells):
+        for c, cell in enumerate(row):
+            if cell.given and not cell.blocked:
+                pending[r * cols + c] = 1
 
-    for cell in puzzle.grid.iter_cells():
-        if cell.pos in visited or cell.blocked or not cell.given:
-            continue
+    clusters: list[list[Position]] = []
+    start = pending.find(1)
+    while start >= 0:
         # BFS
-        from collections import deque
-        q = deque([cell.pos])
-        visited.add(cell.pos)
-        cluster = [cell.pos]
+        pending[start] = 0
+        r0, c0 = divmod(start, cols)
+        q = deque([(r0, c0)])
+        cluster = [cells[r0][c0].pos]
         while q:
-            p = q.popleft()
+            r, c = q.popleft()
             for dr, dc in deltas:
-                nr, nc = p.row + dr, p.col + dc
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    npos = Position(nr, nc)
-                    if npos in visited:
-                        continue
-                    ncell = puzzle.grid.get_cell(npos)
-                    if not ncell.blocked and ncell.given:
-                        visited.add(npos)
-                        q.append(npos)
-                        cluster.append(npos)
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and pending[nr * cols + nc]:
+                    pending[nr * cols + nc] = 0
+                    q.append((nr, nc))
+                    cluster.append(cells[nr][nc].pos)
         clusters.append(cluster)
+        start = pending.find(1, start + 1)
     return clusters
 
 
@@ -554,13 +576,23 @@ def contract_interval(low: int, high: int, reason: str) -> IntervalState:
     Returns:
         New IntervalState with contracted range
     """
-    mid = (low + high) // 2
+    return contract_interval_into(IntervalState(low, high), reason)
+
+
+def contract_interval_into(state: IntervalState, reason: str) -> IntervalState:
+    """In-place variant of contract_interval; updates and returns state.
+    
+    Lets the pruning loop reuse one IntervalState across contractions.
+    """
+    mid = (state.low_index + state.high_index) >> 1
     if reason == "uniqueness_fail":
         # Failed at mid; shrink upper bound
-        return IntervalState(low, mid - 1, reason)
+        state.high_index = mid - 1
     else:
         # Success at mid; try more aggressive removal
-        return IntervalState(mid + 1, high, reason)
+        state.low_index = mid + 1
+    state.contraction_reason = reason
+    return state
 
 
 def should_fallback_to_linear(removable_count: int, fallback_k: int) -> bool:
@@ -648,6 +680,15 @@ def _estimate_ambiguity_score(puzzle: Puzzle) -> int:
     ambiguous link. Sum across all v. Higher score suggests likely non-uniqueness
     in sparse, diagonal-adjacency puzzles.
     """
+    return sum(1 for empties in _open_link_empty_neighbors(puzzle) if len(empties) >= 2)
+
+
+def _open_link_empty_neighbors(puzzle: Puzzle) -> list[list[Position]]:
+    """Empty neighbours of every placed v whose successor v+1 isn't placed yet.
+
+    Shared by ``_estimate_ambiguity_score`` (which counts the entries with >=2
+    choices) and ``_compute_flex_zone_size``.
+    """
     # Build map of placed values to positions and set of placed values
     placed = {}
     for row in puzzle.grid.cells:
@@ -658,7 +699,7 @@ def _estimate_ambiguity_score(puzzle: Puzzle) -> int:
     min_v = puzzle.constraints.min_value
     max_v = puzzle.constraints.max_value
 
-    ambiguous_links = 0
+    open_links = []
     for v, pos in placed.items():
         if v < min_v or v >= max_v:
             continue
@@ -666,35 +707,49 @@ def _estimate_ambiguity_score(puzzle: Puzzle) -> int:
         # Skip if successor is already placed
         if succ in placed:
             continue
-        # Count empty neighbors around v
-        empty_neighbors = 0
+        # Collect empty neighbors around v
+        empties = []
         for npos in puzzle.grid.neighbors_of(pos):
             ncell = puzzle.grid.get_cell(npos)
             if not ncell.blocked and ncell.value is None:
-                empty_neighbors += 1
-        if empty_neighbors >= 2:
-            ambiguous_links += 1
-    return ambiguous_links
+                empties.append(npos)
+        open_links.append(empties)
+    return open_links
 
 
-def _detect_high_value_tail(puzzle: Puzzle) -> tuple[int, int]:
+def _sorted_given_values(puzzle: Puzzle) -> list[int]:
+    """Values of all unblocked given cells, ascending.
+
+    The anchor guards (dispersion, head/tail) all read this list; callers that
+    run several of them collect it once and pass it along.
+    """
+    given_values = [
+        cell.value
+        for row in puzzle.grid.cells
+        for cell in row
+        if not cell.blocked and cell.given and cell.value is not None
+    ]
+    given_values.sort()
+    return given_values
+
+
+def _detect_high_value_tail(puzzle: Puzzle, given_values: Optional[list[int]] = None) -> tuple[int, int]:
     """Detect length of consecutive given tail ending near max value.
 
     Returns (tail_len, tail_start_value). Tail is counted over given cells only,
     descending from max_value while each value is present as a given.
+    given_values may be a precomputed _sorted_given_values(puzzle).
     """
-    given_values = set()
-    for row in puzzle.grid.cells:
-        for cell in row:
-            if not cell.blocked and cell.given and cell.value is not None:
-                given_values.add(cell.value)
+    if given_values is None:
+        given_values = _sorted_given_values(puzzle)
+    present = set(given_values)
 
     min_v = puzzle.constraints.min_value
     max_v = puzzle.constraints.max_value
 
     v = max_v
     tail_len = 0
-    while v >= min_v and v in given_values:
+    while v >= min_v and v in present:
         tail_len += 1
         v -= 1
     tail_start_value = v + 1 if tail_len > 0 else max_v
@@ -708,46 +763,42 @@ SPARSE_DENSITY_THRESHOLD = 0.30  # Consider sparse if clue density below this
 MAX_VALUE_GAP = 12          # Reject if largest gap between consecutive given values exceeds this
 
 
-def _detect_low_value_head(puzzle: Puzzle) -> tuple[int, int]:
+def _detect_low_value_head(puzzle: Puzzle, given_values: Optional[list[int]] = None) -> tuple[int, int]:
     """Detect length of consecutive given head starting from min value.
 
     Returns (head_len, head_end_value). Head is counted over given cells only,
     ascending from min_value while each value is present as a given.
+    given_values may be a precomputed _sorted_given_values(puzzle).
     """
-    given_values = set()
-    for row in puzzle.grid.cells:
-        for cell in row:
-            if not cell.blocked and cell.given and cell.value is not None:
-                given_values.add(cell.value)
+    if given_values is None:
+        given_values = _sorted_given_values(puzzle)
+    present = set(given_values)
 
     min_v = puzzle.constraints.min_value
     max_v = puzzle.constraints.max_value
 
     v = min_v
     head_len = 0
-    while v <= max_v and v in given_values:
+    while v <= max_v and v in present:
         head_len += 1
         v += 1
     head_end_value = v - 1 if head_len > 0 else min_v
     return head_len, head_end_value
 
 
-def _compute_anchor_dispersion(puzzle: Puzzle) -> int:
+def _compute_anchor_dispersion(puzzle: Puzzle, given_values: Optional[list[int]] = None) -> int:
     """Compute largest gap between consecutive given values (A: Dispersion metric).
     
     Returns the maximum span of consecutive missing values between any two adjacent givens.
     Large gaps indicate poor anchor distribution and high ambiguity risk.
+    given_values may be a precomputed _sorted_given_values(puzzle).
     """
-    given_values = []
-    for row in puzzle.grid.cells:
-        for cell in row:
-            if not cell.blocked and cell.given and cell.value is not None:
-                given_values.append(cell.value)
+    if given_values is None:
+        given_values = _sorted_given_values(puzzle)
     
     if len(given_values) < 2:
         return 0
     
-    given_values.sort()
     max_gap = 0
     for i in range(len(given_values) - 1):
         gap = given_values[i + 1] - given_values[i] - 1
@@ -757,20 +808,32 @@ def _compute_anchor_dispersion(puzzle: Puzzle) -> int:
 
 
 
-def check_puzzle_uniqueness(puzzle: Puzzle, solver_mode: str) -> bool:
+def check_puzzle_uniqueness(puzzle: Puzzle, solver_mode: str, return_solution: bool = False):
     """Check if puzzle has exactly one solution.
     
     Args:
         puzzle: Puzzle to check
         solver_mode: Solver mode string (unused, kept for signature compatibility)
+        return_solution: If True, also return a solution found along the way
     
     Returns:
-        True if puzzle has unique solution (exactly 1 solution, not just solvable)
+        True if puzzle has unique solution (exactly 1 solution, not just solvable).
+        With return_solution=True, a tuple (is_unique, solution) where solution is
+        a position->value dict from the alternate-sampling pass, or None if no
+        solve was run or none succeeded.
         
     Notes:
         Uses staged uniqueness validation with bounded search and time budgets.
         Falls back to old method if staged checker returns inconclusive.
     """
+    is_unique, solution = _check_puzzle_uniqueness(puzzle, solver_mode)
+    if return_solution:
+        return is_unique, solution
+    return is_unique
+
+
+def _check_puzzle_uniqueness(puzzle: Puzzle, solver_mode: str) -> tuple[bool, Optional[dict]]:
+    """Implementation of check_puzzle_uniqueness returning (is_unique, solution)."""
     # Option 1: Use staged uniqueness checker (ENABLED)
     from generate.uniqueness_staged import create_request, check_uniqueness, UniquenessDecision
     
@@ -795,9 +858,10 @@ def check_puzzle_uniqueness(puzzle: Puzzle, solver_mode: str) -> bool:
         
         # A: Check anchor dispersion ALWAYS for 8-neighbor puzzles (critical structural check)
         if puzzle.constraints.allow_diagonal and puzzle.grid.rows >= 9:
-            max_gap = _compute_anchor_dispersion(puzzle)
+            given_values = _sorted_given_values(puzzle)  # Shared by the anchor guards
+            max_gap = _compute_anchor_dispersion(puzzle, given_values)
             if max_gap > MAX_VALUE_GAP:
-                return False
+                return False, None
         
         if (puzzle.constraints.allow_diagonal
                 and puzzle.grid.rows >= 9
@@ -807,35 +871,35 @@ def check_puzzle_uniqueness(puzzle: Puzzle, solver_mode: str) -> bool:
             if max_gap > 15:
                 path_count = _bidirectional_path_search(puzzle, max_gap, time_cap_ms=2000)
                 if path_count >= 2:
-                    return False  # Found multiple distinct paths
+                    return False, None  # Found multiple distinct paths
             
             # C: Check region span fit - reject if large capacity mismatch
             region_mismatch = _compute_region_span_fit(puzzle)
             if region_mismatch > 20:  # Threshold for 9x9 boards
-                return False
+                return False, None
             
             # E: Check flex zone size - reject if too many unconstrained cells
             # (This is expensive, only run if other checks passed but still sparse)
             if density < 0.28:
                 flex_zone_size = _compute_flex_zone_size(puzzle)
                 if flex_zone_size > 30:  # Large unconstrained area
-                    return False
+                    return False, None
             
-            tail_len, tail_start = _detect_high_value_tail(puzzle)
-            head_len, head_end = _detect_low_value_head(puzzle)
+            tail_len, tail_start = _detect_high_value_tail(puzzle, given_values)
+            head_len, head_end = _detect_low_value_head(puzzle, given_values)
             # New stricter policy: any tail >= threshold triggers rejection to drive anchor retention
             if tail_len >= TAIL_REJECT_LEN or head_len >= TAIL_REJECT_LEN:
-                return False
+                return False, None
             ambiguity = _estimate_ambiguity_score(puzzle)
             if ambiguity >= AMBIGUITY_STRICT_THRESHOLD:
                 from generate.uniqueness import count_solutions
                 strict = count_solutions(
                     puzzle, cap=2, node_cap=25000, timeout_ms=12000
                 )
-                return strict.is_unique
-        return True
+                return strict.is_unique, None
+        return True, None
     elif result.decision == UniquenessDecision.NON_UNIQUE:
-        return False
+        return False, None
     else:  # INCONCLUSIVE
         # Fallback to old method for inconclusive cases
         from generate.uniqueness import count_solutions
@@ -848,15 +912,16 @@ def check_puzzle_uniqueness(puzzle: Puzzle, solver_mode: str) -> bool:
             timeout_ms = 40000
         fallback_result = count_solutions(puzzle, cap=2, node_cap=node_cap, timeout_ms=timeout_ms)
         if not fallback_result.is_unique and fallback_result.solutions_found >= 2:
-            return False
+            return False, None
         
         # A: Check anchor dispersion ALWAYS for 8-neighbor puzzles (even if not sparse)
         if (fallback_result.is_unique
                 and puzzle.constraints.allow_diagonal
                 and puzzle.grid.rows >= 9):
-            max_gap = _compute_anchor_dispersion(puzzle)
+            given_values = _sorted_given_values(puzzle)  # Shared by the anchor guards
+            max_gap = _compute_anchor_dispersion(puzzle, given_values)
             if max_gap > MAX_VALUE_GAP:
-                return False
+                return False, None
         
         # Apply same tail guardrail even if staged checker was inconclusive
         if (fallback_result.is_unique
@@ -866,24 +931,25 @@ def check_puzzle_uniqueness(puzzle: Puzzle, solver_mode: str) -> bool:
             # C: Check region span fit in fallback too
             region_mismatch = _compute_region_span_fit(puzzle)
             if region_mismatch > 20:
-                return False
+                return False, None
             
-            tail_len, _ = _detect_high_value_tail(puzzle)
-            head_len, _ = _detect_low_value_head(puzzle)
+            tail_len, _ = _detect_high_value_tail(puzzle, given_values)
+            head_len, _ = _detect_low_value_head(puzzle, given_values)
             if tail_len >= TAIL_REJECT_LEN or head_len >= TAIL_REJECT_LEN:
-                return False
+                return False, None
         # As a last resort, attempt alternate sampling to expose ambiguity
         alternates = sample_alternate_solutions(
             puzzle, path=[], solver_mode=solver_mode, alternates_count=3, time_cap_ms=3000
         )
+        solution = alternates[0] if alternates else None
         if len(alternates) >= 2:
             # If we found two distinct completions, it's not unique
             # Compare first two alternates on any differing cell
             a0 = alternates[0]
             for a in alternates[1:]:
                 if any((pos in a0 and pos in a and a0[pos] != a[pos]) for pos in a0.keys() & a.keys()):
-                    return False
-        return fallback_result.is_unique
+                    return False, solution
+        return fallback_result.is_unique, solution
 
 
 
@@ -1268,8 +1334,10 @@ def _bidirectional_path_search(puzzle: Puzzle, max_gap: int, time_cap_ms: int =
     def build_greedy_forward_path(start_val, end_val, start_pos):
         """Build path from start_val toward end_val using greedy adjacency."""
         path = [start_pos]
+        on_path = {start_pos}
         current_val = start_val
         current_pos = start_pos
+        end_pos = value_to_pos.get(end_val)
         
         for next_val in range(start_val + 1, end_val):
             if (time.time() - start_time) * 1000 > time_cap_ms:
@@ -1282,19 +1350,19 @@ def _bidirectional_path_search(puzzle: Puzzle, max_gap: int, time_cap_ms: int =
                 ncell = puzzle.grid.get_cell(npos)
                 if ncell.blocked or (ncell.given and ncell.value != next_val):
                     continue
-                if npos not in path:  # Avoid cycles
+                if npos not in on_path:  # Avoid cycles
                     candidates.append(npos)
             
             if not candidates:
                 return None  # Dead end
             
             # Greedy: pick neighbor closest to end (Manhattan distance heuristic)
-            end_pos = value_to_pos.get(end_val)
             if end_pos:
                 candidates.sort(key=lambda p: abs(p.row - end_pos.row) + abs(p.col - end_pos.col))
             
             current_pos = candidates[0]
             path.append(current_pos)
+            on_path.add(current_pos)
             current_val = next_val
         
         return path
@@ -1302,8 +1370,10 @@ def _bidirectional_path_search(puzzle: Puzzle, max_gap: int, time_cap_ms: int =
     def build_greedy_backward_path(start_val, end_val, end_pos):
         """Build path from end_val backward toward start_val."""
         path = [end_pos]
+        on_path = {end_pos}
         current_val = end_val
         current_pos = end_pos
+        start_pos = value_to_pos.get(start_val)
         
         for prev_val in range(end_val - 1, start_val, -1):
             if (time.time() - start_time) * 1000 > time_cap_ms:
@@ -1315,19 +1385,19 @@ def _bidirectional_path_search(puzzle: Puzzle, max_gap: int, time_cap_ms: int =
                 ncell = puzzle.grid.get_cell(npos)
                 if ncell.blocked or (ncell.given and ncell.value != prev_val):
                     continue
-                if npos not in path:
+                if npos not in on_path:
                     candidates.append(npos)
             
             if not candidates:
                 return None
             
             # Greedy: pick neighbor closest to start
-            start_pos = value_to_pos.get(start_val)
             if start_pos:
                 candidates.sort(key=lambda p: abs(p.row - start_pos.row) + abs(p.col - start_pos.col))
             
             current_pos = candidates[0]
             path.append(current_pos)
+            on_path.add(current_pos)
             current_val = prev_val
         
         return list(reversed(path))
@@ -1367,9 +1437,16 @@ def _compute_flex_zone_size(puzzle: Puzzle) -> int:
     Returns:
         Number of cells in the largest flex zone
     """
-    # Baseline ambiguity score
-    baseline_ambiguity = _estimate_ambiguity_score(puzzle)
-    
+    # Blocking an empty cell only drops it from the empty-neighbour lists of
+    # the open links around it, so the ambiguity score changes exactly when
+    # one of those links had two choices (>=2 -> 1). One pass over the links
+    # replaces a full re-score per cell.
+    critical = set()
+    for empties in _open_link_empty_neighbors(puzzle):
+        if len(empties) == 2:
+            critical.update(empties)
+
+    baseline_ambiguity = None
     flex_cells = []
     
     # Test each non-given cell
@@ -1378,15 +1455,18 @@ def _compute_flex_zone_size(puzzle: Puzzle) -> int:
             if cell.blocked or cell.given:
                 continue
             
-            # Temporarily mark as blocked
-            original_blocked = cell.blocked
-            cell.blocked = True
+            if cell.value is None:
+                if cell.pos not in critical:
+                    flex_cells.append(cell.pos)
+                continue
             
-            # Re-compute ambiguity
+            # Placed non-given value: blocking it also unplaces the value, so
+            # re-score the board the long way
+            if baseline_ambiguity is None:
+                baseline_ambiguity = _estimate_ambiguity_score(puzzle)
+            cell.blocked = True
             new_ambiguity = _estimate_ambiguity_score(puzzle)
-            
-            # Restore
-            cell.blocked = original_blocked
+            cell.blocked = False
             
             # If ambiguity unchanged, this cell is in the flex zone
             if new_ambiguity == baseline_ambiguity:
@@ -1497,6 +1577,7 @@ def prune_puzzle(
     
     # Interval reduction phase
     low_index, high_index = 0, len(removable) - 1
+    interval = IntervalState(low_index, high_index)
     last_unique_snapshot = snapshot_puzzle_state(puzzle)
     
     while low_index <= high_index:
@@ -1536,8 +1617,9 @@ def prune_puzzle(
         if (target_difficulty in ["hard", "extreme"]
                 and puzzle.constraints.allow_diagonal
                 and puzzle.grid.rows >= 9):
-            t_len, _ = _detect_high_value_tail(puzzle)
-            h_len, _ = _detect_low_value_head(puzzle)
+            given_values = _sorted_given_values(puzzle)
+            t_len, _ = _detect_high_value_tail(puzzle, given_values)
+            h_len, _ = _detect_low_value_head(puzzle, given_values)
             if t_len >= TAIL_REJECT_LEN or h_len >= TAIL_REJECT_LEN:
                 min_density = max(min_density, 0.34)
                 max_density = max(max_density, 0.40)
@@ -1583,9 +1665,9 @@ def prune_puzzle(
             
             # Success: save state and try more aggressive removal
             last_unique_snapshot = snapshot_puzzle_state(puzzle)
-            state = contract_interval(low_index, high_index, "density_met")
-            session.record_interval_contraction(state)
-            low_index = state.low_index
+            contract_interval_into(interval, "density_met")
+            session.record_interval_contraction(interval)
+            low_index = interval.low_index
         else:
             # Failure: revert and try repair (T05-T08)
             restore_puzzle_state(puzzle, snapshot)
@@ -1600,8 +1682,9 @@ def prune_puzzle(
                 if (puzzle.constraints.allow_diagonal
                         and puzzle.grid.rows >= 9
                         and density < SPARSE_DENSITY_THRESHOLD):
-                    tail_len, _ = _detect_high_value_tail(puzzle)
-                    head_len, _ = _detect_low_value_head(puzzle)
+                    given_values = _sorted_given_values(puzzle)
+                    tail_len, _ = _detect_high_value_tail(puzzle, given_values)
+                    head_len, _ = _detect_low_value_head(puzzle, given_values)
                     if tail_len >= TAIL_REJECT_LEN or head_len >= TAIL_REJECT_LEN:
                         # Pick a mid-range value near the center that's not currently a given
                         min_v = puzzle.constraints.min_value
@@ -1725,9 +1808,9 @@ def prune_puzzle(
                     continue
             
             # Contract interval (either no repair or repair failed)
-            state = contract_interval(low_index, high_index, "uniqueness_fail")
-            session.record_interval_contraction(state)
-            high_index = state.high_index
+            contract_interval_into(interval, "uniqueness_fail")
+            session.record_interval_contraction(interval)
+            high_index = interval.high_index
     
     # Check if we exhausted repairs or timed out
     final_status = PruningStatus.SUCCESS
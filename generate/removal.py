@@ -2,6 +2,7 @@
 
 Removal scoring and heuristics for clue removal during generation.
 """
+from generate.util.connectivity import manhattan_distance_field
 
 
 def score_candidates(givens, path, anchors, grid):
@@ -24,6 +25,8 @@ def score_candidates(givens, path, anchors, grid):
     from core.position import Position
     
     candidates = []
+    # Nearest-anchor distance per cell, computed once instead of per given
+    nearest = manhattan_distance_field(anchors, grid.rows, grid.cols)
     
     for pos in givens:
         # Don't score anchors
@@ -33,10 +36,13 @@ def score_candidates(givens, path, anchors, grid):
         score = 0.0
         
         # 1. Distance from nearest anchor (0-1 normalized)
-        min_distance = float('inf')
-        for anchor in anchors:
-            dist = abs(pos.row - anchor.row) + abs(pos.col - anchor.col)
-            min_distance = min(min_distance, dist)
+        if nearest is not None and 0 <= pos.row < grid.rows and 0 <= pos.col < grid.cols:
+            min_distance = nearest[pos.row * grid.cols + pos.col]
+        else:
+            min_distance = float('inf')
+            for anchor in anchors:
+                dist = abs(pos.row - anchor.row) + abs(pos.col - anchor.col)
+                min_distance = min(min_distance, dist)
         if min_distance != float('inf'):
             max_dist = grid.rows + grid.cols
             score += (min_distance / max_dist) * 0.4
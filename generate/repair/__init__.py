@@ -3,12 +3,13 @@
 T034: Orchestrates structural repair to restore uniqueness.
 """
 from typing import List, Tuple, Optional, Dict
+from itertools import chain, islice
 import time
 from core.grid import Grid
 from core.position import Position
 from generate.repair.models import RepairAction, AmbiguityRegion
 from generate.repair.diff import diff_multiple_solutions
-from generate.repair.scoring import score_structural_blocks
+from generate.repair.scoring import iter_structural_blocks
 from solve.solver import Solver
 
 
@@ -33,38 +34,41 @@ def apply_structural_repair(grid: Grid,
     Returns:
         Dict with 'actions', 'uniqueness_restored', 'solvability_verified' or None
     """
-    start_time = time.time()
-    
-    # No repair needed if 0 or 1 solution
+    # No repair needed if 0 or 1 solution (checked before any other setup)
     if len(solutions) < 2:
         return None
     
+    deadline_ns = time.monotonic_ns() + int(timeout_ms * 1_000_000)
+    
     # Identify ambiguity regions
     regions = diff_multiple_solutions(solutions, grid.rows, grid.adjacency.allow_diagonal)
     
     if not regions:
         return None  # No divergences found
     
-    # Score candidate blocking positions
+    # Score candidate blocking positions; pulled best-first, so only the
+    # max_repairs candidates actually tried are ever ordered
     given_positions = [Position(r, c) for r, c, _ in givens]
-    candidates = score_structural_blocks(regions, grid, given_positions)
+    candidates = iter_structural_blocks(regions, grid, given_positions)
     
-    if not candidates:
+    first = next(candidates, None)
+    if first is None:
         return {'actions': [], 'uniqueness_restored': False}
     
     actions = []
     uniqueness_restored = False
     
     # Try blocking top-scored positions
-    for i, candidate in enumerate(candidates[:max_repairs]):
+    for i, candidate in enumerate(islice(chain((first,), candidates), max_repairs)):
         # Check timeout
-        elapsed = (time.time() - start_time) * 1000
-        if elapsed > timeout_ms:
+        if time.monotonic_ns() > deadline_ns:
             break
         
-        # Try blocking this position
+        # Trial-block on the live grid (push); rolled back below (pop) if the
+        # block is rejected, instead of rebuilding a grid copy per candidate
         pos = candidate.position
-        grid_copy = _copy_grid_with_block(grid, pos)
+        cell = grid.get_cell(pos)
+        cell.blocked = True
         
         # Verify solvability if requested
         # TODO: Implement proper solvability check with Puzzle creation
@@ -73,16 +77,17 @@ def apply_structural_repair(grid: Grid,
         solvability_ok = True  # Assume OK unless we implement the check
         
         if verify_solvability:
-            # TODO: Create Puzzle from grid_copy + givens, then solve
+            # TODO: Create Puzzle from grid (block applied) + givens, then solve
             # from core.puzzle import Puzzle
             # from core.constraints import Constraints
-            # puzzle = Puzzle(grid_copy, Constraints(...))
+            # puzzle = Puzzle(grid, Constraints(...))
             # result = Solver.solve(puzzle, mode="logic_v0")
             # solvability_ok = result.solved
             pass
         
         if not solvability_ok:
-            # Blocking makes puzzle unsolvable, skip
+            # Blocking makes puzzle unsolvable, roll back and skip
+            cell.blocked = False
             action = RepairAction(
                 action_type='block',
                 position=(pos.row, pos.col),
@@ -92,9 +97,7 @@ def apply_structural_repair(grid: Grid,
             actions.append(action)
             continue
         
-        # Apply block
-        grid.get_cell(pos).blocked = True
-        
+        # Block stays applied
         action = RepairAction(
             action_type='block',
             position=(pos.row, pos.col),
@@ -148,29 +151,3 @@ def apply_structural_repair(grid: Grid,
         'uniqueness_restored': uniqueness_restored,
         'solvability_verified': verify_solvability
     }
-
-
-def _copy_grid_with_block(grid: Grid, pos: Position) -> Grid:
-    """Create a copy of grid with additional block at position.
-    
-    Args:
-        grid: Original grid
-        pos: Position to block
-        
-    Returns:
-        New Grid object with block applied
-    """
-    new_grid = Grid(grid.rows, grid.cols)
-    new_grid.adjacency.allow_diagonal = grid.adjacency.allow_diagonal
-    
-    # Copy existing blocks
-    for r in range(grid.rows):
-        for c in range(grid.cols):
-            if grid.get_cell(Position(r, c)).blocked:
-                new_grid.get_cell(Position(r, c)).blocked = True
-    
-    # Add new block
-    new_grid.get_cell(pos).blocked = True
-    
-    return new_grid
-
@@ -2,10 +2,11 @@
 
 T032: Implements diff_solutions() to identify ambiguity regions from multiple solutions.
 """
-from typing import List, Tuple
+from collections import Counter
+from typing import List, Optional, Set, Tuple
 from core.position import Position
 from generate.util.connectivity import find_connected_components, get_neighbors
-from generate.repair.models import AmbiguityRegion
+from generate.repair.models import MASK_STRIDE, AmbiguityRegion, pack
 
 
 def diff_solutions(solution1: List[Tuple[int, int, int]], 
@@ -23,19 +24,7 @@ def diff_solutions(solution1: List[Tuple[int, int, int]],
     Returns:
         List of AmbiguityRegion objects representing clustered divergences
     """
-    # Build value maps
-    val_map1 = {(r, c): v for r, c, v in solution1}
-    val_map2 = {(r, c): v for r, c, v in solution2}
-    
-    # Find divergent cells
-    divergent_cells = set()
-    all_positions = set(val_map1.keys()) | set(val_map2.keys())
-    
-    for pos in all_positions:
-        val1 = val_map1.get(pos)
-        val2 = val_map2.get(pos)
-        if val1 != val2:
-            divergent_cells.add(pos)  # Keep as tuple
+    divergent_cells = _divergent_cells(solution1, solution2, size)
     
     if not divergent_cells:
         return []
@@ -44,18 +33,20 @@ def diff_solutions(solution1: List[Tuple[int, int, int]],
     regions = find_connected_components(divergent_cells, size, allow_diagonal)
     
     # Create AmbiguityRegion objects (divergence_count=2 for two solutions)
-    return [AmbiguityRegion(cells=cells, divergence_count=2) for cells in regions]
+    return [_make_region(cells, 2, size) for cells in regions]
 
 
 def diff_multiple_solutions(solutions: List[List[Tuple[int, int, int]]], 
                            size: int,
-                           allow_diagonal: bool = True) -> List[AmbiguityRegion]:
+                           allow_diagonal: bool = True,
+                           min_divergence: Optional[int] = None) -> List[AmbiguityRegion]:
     """Diff multiple solutions and aggregate divergence frequencies.
     
     Args:
         solutions: List of solutions
         size: Grid size
         allow_diagonal: Whether to consider diagonal adjacency
+        min_divergence: Ignore cells where fewer solution pairs disagree
         
     Returns:
         List of AmbiguityRegion objects with aggregated frequencies
@@ -63,19 +54,35 @@ def diff_multiple_solutions(solutions: List[List[Tuple[int, int, int]]],
     if len(solutions) < 2:
         return []
     
-    # Track divergence frequency per position
+    # Track divergence frequency per position: the number of solution pairs
+    # that disagree there
     divergence_count_map = {}
     
-    # Compare all pairs of solutions
-    for i in range(len(solutions)):
-        for j in range(i + 1, len(solutions)):
-            val_map_i = {(r, c): v for r, c, v in solutions[i]}
-            val_map_j = {(r, c): v for r, c, v in solutions[j]}
-            
-            all_pos = set(val_map_i.keys()) | set(val_map_j.keys())
-            for pos in all_pos:
-                if val_map_i.get(pos) != val_map_j.get(pos):
-                    divergence_count_map[pos] = divergence_count_map.get(pos, 0) + 1
+    grids = [_solution_grid(solution, size) for solution in solutions]
+    if all(grid is not None for grid in grids):
+        # Walk the cells column-wise across all K solutions at once. Pairs that
+        # disagree = all pairs - pairs sharing a value, so no K^2 pair loop.
+        k = len(grids)
+        total_pairs = k * (k - 1) // 2
+        for i, values in enumerate(zip(*grids)):
+            if values.count(values[0]) == k:
+                continue
+            agreeing = sum(n * (n - 1) // 2 for n in Counter(values).values())
+            divergence_count_map[divmod(i, size)] = total_pairs - agreeing
+    else:
+        # Cells outside the square grid: compare all pairs by position
+        val_maps = [{(r, c): v for r, c, v in solution} for solution in solutions]
+        for i in range(len(val_maps)):
+            for j in range(i + 1, len(val_maps)):
+                val_map_i, val_map_j = val_maps[i], val_maps[j]
+                for pos in val_map_i.keys() | val_map_j.keys():
+                    if val_map_i.get(pos) != val_map_j.get(pos):
+                        divergence_count_map[pos] = divergence_count_map.get(pos, 0) + 1
+    
+    if min_divergence is not None:
+        divergence_count_map = {
+            pos: count for pos, count in divergence_count_map.items() if count >= min_divergence
+        }
     
     if not divergence_count_map:
         return []
@@ -89,7 +96,49 @@ def diff_multiple_solutions(solutions: List[List[Tuple[int, int, int]]],
     for cluster in clusters:
         # Max frequency for any cell in cluster
         max_freq = max(divergence_count_map[cell] for cell in cluster)
-        regions.append(AmbiguityRegion(cells=cluster, divergence_count=max_freq))
+        regions.append(_make_region(cluster, max_freq, size))
     
     return regions
 
+
+def _make_region(cells: Set[Tuple[int, int]], divergence_count: int, size: int) -> AmbiguityRegion:
+    """Build a region, keeping only the packed mask when the grid fits one.
+    
+    The cell set is then rebuilt from the mask only if something reads
+    ``region.cells``.
+    """
+    if size <= MASK_STRIDE and all(0 <= r < MASK_STRIDE and 0 <= c < MASK_STRIDE for r, c in cells):
+        mask = 0
+        for r, c in cells:
+            mask |= pack(r, c)
+        return AmbiguityRegion(cells_mask=mask, divergence_count=divergence_count)
+    return AmbiguityRegion(cells=cells, divergence_count=divergence_count)
+
+
+def _solution_grid(solution: List[Tuple[int, int, int]], size: int) -> Optional[List[int]]:
+    """Flatten a solution into a row-major list of size*size values (0 = absent).
+    
+    Returns None if any cell lies outside the size x size grid.
+    """
+    grid = [0] * (size * size)
+    for r, c, v in solution:
+        if not (0 <= r < size and 0 <= c < size):
+            return None
+        grid[r * size + c] = v
+    return grid
+
+
+def _divergent_cells(solution1: List[Tuple[int, int, int]],
+                     solution2: List[Tuple[int, int, int]],
+                     size: int) -> Set[Tuple[int, int]]:
+    """Return the (row, col) cells whose values differ between two solutions."""
+    grid1 = _solution_grid(solution1, size)
+    grid2 = _solution_grid(solution2, size)
+    if grid1 is not None and grid2 is not None:
+        # One pass over two flat value lists instead of building and merging dicts
+        return {divmod(i, size) for i, (v1, v2) in enumerate(zip(grid1, grid2)) if v1 != v2}
+    
+    # Cells outside the square grid (non-square boards): compare by position
+    val_map1 = {(r, c): v for r, c, v in solution1}
+    val_map2 = {(r, c): v for r, c, v in solution2}
+    return {pos for pos in val_map1.keys() | val_map2.keys() if val_map1.get(pos) != val_map2.get(pos)}
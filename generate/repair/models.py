@@ -3,22 +3,80 @@ from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+# Row stride used when packing cells into a bitmask. Any grid up to 8x8
+# (64 cells) fits in a single 64-bit integer.
+MASK_STRIDE = 8
+
+
+def pack(row: int, col: int, size: int = MASK_STRIDE) -> int:
+    """Return the single-bit mask for (row, col) with the given row stride."""
+    return 1 << (row * size + col)
+
+
+def unpack(mask: int, size: int = MASK_STRIDE) -> set[tuple[int, int]]:
+    """Expand a packed bitmask back into a set of (row, col) tuples."""
+    cells = set()
+    while mask:
+        idx = (mask & -mask).bit_length() - 1
+        mask &= mask - 1
+        cells.add(divmod(idx, size))
+    return cells
+
+
+class _LazyCells:
+    """Descriptor for ``AmbiguityRegion.cells``.
+    
+    Regions built from a packed mask only expand it into a frozenset of
+    tuples the first time ``cells`` is read; scoring works from the mask and
+    never does. Both views are fixed once the region is constructed.
+    """
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return None  # Dataclass field default
+        if obj._cells is None:
+            object.__setattr__(obj, "_cells", frozenset(unpack(obj.cells_mask)))
+        return obj._cells
+
+    def __set__(self, obj, value):
+        if "_cells" in obj.__dict__:
+            raise AttributeError("AmbiguityRegion.cells is read-only")
+        object.__setattr__(obj, "_cells", None if value is None else frozenset(value))
+
+
+@dataclass(frozen=True)
 class AmbiguityRegion:
     """Cluster of cells where divergent solutions differ.
     
+    Regions are immutable so ``cells`` and ``cells_mask`` cannot drift apart.
+    
     Attributes:
-        cells: Set of positions in this ambiguity region
+        cells: Frozenset of positions in this ambiguity region (expanded
+            lazily from ``cells_mask`` when only the mask was supplied)
         divergence_count: Number of distinct solution paths touching region
         corridor_width: Computed width via flood (lower = more constrained)
         distance_from_clues: Minimum Manhattan distance to any clue
         score: Calculated priority score for blocking
+        cells_mask: Packed bitmask of ``cells`` (see ``pack``); 0 when the
+            region is empty or does not fit in an 8x8 grid
     """
-    cells: set[tuple[int, int]]
+    cells: frozenset[tuple[int, int]] = _LazyCells()
     divergence_count: int = 0
     corridor_width: int = 0
     distance_from_clues: int = 0
     score: float = 0.0
+    cells_mask: int = 0
+
+    def __post_init__(self):
+        cells = self._cells
+        # Derive the mask when only cells were supplied; the reverse
+        # direction is left to _LazyCells
+        if cells and not self.cells_mask:
+            if all(0 <= r < MASK_STRIDE and 0 <= c < MASK_STRIDE for r, c in cells):
+                mask = 0
+                for r, c in cells:
+                    mask |= pack(r, c)
+                object.__setattr__(self, "cells_mask", mask)
 
 
 @dataclass
@@ -2,11 +2,18 @@
 
 T033: Scores candidate blocking positions based on frequency × corridor_width × distance.
 """
-from typing import List, Tuple, Set
+import heapq
+from typing import Iterator, List, Optional, Tuple, Set
 from dataclasses import dataclass
 from core.position import Position
 from core.grid import Grid
-from generate.repair.models import AmbiguityRegion
+from generate.repair.models import AmbiguityRegion, MASK_STRIDE, pack
+from generate.util.connectivity import manhattan_distance_field
+
+
+# Neighbour offsets, orthogonal first (the order candidates have always been visited in)
+_DELTAS_4 = ((0, 1), (1, 0), (0, -1), (-1, 0))
+_DELTAS_8 = _DELTAS_4 + ((1, 1), (1, -1), (-1, 1), (-1, -1))
 
 
 @dataclass
@@ -35,87 +42,217 @@ def score_structural_blocks(regions: List[AmbiguityRegion],
     if not regions:
         return []
     
-    candidates = []
+    components = _score_components(regions, grid, givens)
+    scores = components[1]
+    
+    # Sort by score (highest first); stable, so ties keep discovery order
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    
+    return [_build_candidate(components, i) for i in order]
+
+
+def iter_structural_blocks(regions: List[AmbiguityRegion],
+                           grid: Grid,
+                           givens: List[Position]) -> Iterator[ScoredCandidate]:
+    """Yield scored candidates best-first without sorting the whole list.
+    
+    Same order as ``score_structural_blocks``, but candidates are popped off a
+    heap on demand, so a consumer that stops after a few tries never pays for
+    ordering (or building) the rest.
+    
+    Args:
+        regions: List of ambiguity regions
+        grid: Current grid state
+        givens: List of given (clue) positions
+        
+    Yields:
+        ScoredCandidate objects, highest score first
+    """
+    if not regions:
+        return
+    
+    components = _score_components(regions, grid, givens)
+    # (-score, discovery index) keeps ties in discovery order
+    heap = [(-score, i) for i, score in enumerate(components[1])]
+    heapq.heapify(heap)
+    while heap:
+        _, i = heapq.heappop(heap)
+        yield _build_candidate(components, i)
+
+
+def _score_components(regions: List[AmbiguityRegion],
+                      grid: Grid,
+                      givens: List[Position]) -> Tuple[list, list, list, list, list]:
+    """Score every candidate around regions, in discovery order.
+    
+    Returns:
+        Parallel lists (positions, scores, frequencies, corridor widths,
+        distance scores); ScoredCandidate objects are only built by callers
+        once they know the order
+    """
+    fits_mask = grid.rows <= MASK_STRIDE and grid.cols <= MASK_STRIDE
+    # Snapshot blocked flags once; corridor scoring reads them per candidate
+    blocked = _snapshot_blocked(grid)
+    # Nearest-given distances for every cell, computed once for all candidates
+    distances = manhattan_distance_field(givens, grid.rows, grid.cols)
+    
+    positions = []
+    scores = []
+    frequencies = []
+    corridor_widths = []
+    distance_scores = []
     
     for region in regions:
         # Get candidate positions adjacent to region
-        candidate_positions = _get_adjacent_candidates(region.cells, grid, givens)
+        if fits_mask and region.cells_mask:
+            candidate_positions = _get_adjacent_candidates_masked(region.cells_mask, grid, givens, blocked)
+        else:
+            candidate_positions = _get_adjacent_candidates(region.cells, grid, givens, blocked)
         
+        frequency_score = region.divergence_count
         for pos in candidate_positions:
             # Calculate score components
-            frequency_score = region.divergence_count
-            corridor_score = _calculate_corridor_width_score(pos, grid)
-            distance_score = _calculate_distance_score(pos, givens, grid.rows)
+            corridor_score = _calculate_corridor_width_score(pos, grid, blocked)
+            distance_score = _calculate_distance_score(pos, givens, grid.rows, distances, grid.cols)
             
             # Combined score: frequency × corridor_width × distance
-            total_score = frequency_score * corridor_score * distance_score
-            
-            candidates.append(ScoredCandidate(
-                position=pos,
-                score=total_score,
-                frequency=frequency_score,
-                corridor_width=corridor_score,
-                distance_from_givens=distance_score
-            ))
-    
-    # Sort by score (highest first)
-    candidates.sort(key=lambda c: c.score, reverse=True)
+            positions.append(pos)
+            scores.append(frequency_score * corridor_score * distance_score)
+            frequencies.append(frequency_score)
+            corridor_widths.append(corridor_score)
+            distance_scores.append(distance_score)
     
-    return candidates
+    return positions, scores, frequencies, corridor_widths, distance_scores
+
+
+def _build_candidate(components: Tuple[list, list, list, list, list], i: int) -> ScoredCandidate:
+    """Build the ScoredCandidate at index i of ``_score_components`` output."""
+    positions, scores, frequencies, corridor_widths, distance_scores = components
+    return ScoredCandidate(
+        position=positions[i],
+        score=scores[i],
+        frequency=frequencies[i],
+        corridor_width=corridor_widths[i],
+        distance_from_givens=distance_scores[i]
+    )
 
 
 def _get_adjacent_candidates(region_cells: set,
                              grid: Grid,
-                             givens: List[Position]) -> List[Position]:
+                             givens: List[Position],
+                             blocked: Optional[bytearray] = None) -> List[Position]:
     """Get candidate positions adjacent to ambiguity region.
     
     Args:
         region_cells: Set of (row, col) tuples in ambiguity region
         grid: Current grid
         givens: Given positions (to exclude)
+        blocked: Optional snapshot from ``_snapshot_blocked`` for grid
         
     Returns:
         List of candidate Position objects (unblocked, not givens, adjacent to region)
     """
+    if blocked is None:
+        blocked = _snapshot_blocked(grid)
+    
+    # Excluded cells keyed by row-major index row * cols + col (the blocked
+    # snapshot's layout): givens, region cells, and candidates already taken
+    # (dedupes without hashing Positions)
+    rows, cols = grid.rows, grid.cols
+    excluded = bytearray(rows * cols)
+    for g in givens:
+        if 0 <= g.row < rows and 0 <= g.col < cols:
+            excluded[g.row * cols + g.col] = 1
+    for r, c in region_cells:
+        if 0 <= r < rows and 0 <= c < cols:
+            excluded[r * cols + c] = 1
+    
     candidates = set()
-    given_tuples = {(g.row, g.col) for g in givens}
+    deltas = _DELTAS_8 if grid.adjacency.allow_diagonal else _DELTAS_4
+    for r0, c0 in region_cells:
+        for dr, dc in deltas:
+            r, c = r0 + dr, c0 + dc
+            if 0 <= r < rows and 0 <= c < cols:
+                key = r * cols + c
+                if not excluded[key] and not blocked[key]:
+                    excluded[key] = 1
+                    candidates.add(Position(r, c))
     
-    for cell in region_cells:
-        # Get all neighbors
-        neighbors = _get_neighbors(cell, grid.rows, grid.adjacency.allow_diagonal)
+    return list(candidates)
+
+
+def _get_adjacent_candidates_masked(region_mask: int,
+                                    grid: Grid,
+                                    givens: List[Position],
+                                    blocked: Optional[bytearray] = None) -> List[Position]:
+    """Bitmask variant of ``_get_adjacent_candidates`` for regions within 8x8.
+    
+    Args:
+        region_mask: Packed cell mask (see ``generate.repair.models.pack``)
+        grid: Current grid
+        givens: Given positions (to exclude)
+        blocked: Optional snapshot from ``_snapshot_blocked`` for grid
         
-        for neighbor in neighbors:
-            # Exclude blocked cells, givens, and cells already in region
-            neighbor_tuple = (neighbor.row, neighbor.col)
-            cell = grid.get_cell(neighbor)
-            if (not cell.blocked and
-                neighbor_tuple not in given_tuples and
-                neighbor_tuple not in region_cells):
+    Returns:
+        List of candidate Position objects (unblocked, not givens, adjacent to region)
+    """
+    if blocked is None:
+        blocked = _snapshot_blocked(grid)
+    cols = grid.cols
+    
+    candidates = set()
+    excluded = region_mask
+    for g in givens:
+        if 0 <= g.row < MASK_STRIDE and 0 <= g.col < MASK_STRIDE:
+            excluded |= pack(g.row, g.col)
+    
+    remaining = region_mask
+    while remaining:
+        idx = (remaining & -remaining).bit_length() - 1
+        remaining &= remaining - 1
+        cell = divmod(idx, MASK_STRIDE)
+        
+        for neighbor in _get_neighbors(cell, grid.rows, cols, grid.adjacency.allow_diagonal):
+            if excluded & pack(neighbor.row, neighbor.col):
+                continue
+            if not blocked[neighbor.row * cols + neighbor.col]:
                 candidates.add(neighbor)
     
     return list(candidates)
 
 
-def _calculate_corridor_width_score(pos: Position, grid: Grid) -> float:
+def _snapshot_blocked(grid: Grid) -> bytearray:
+    """Blocked flags for grid as one flat row-major buffer.
+    
+    Index with ``row * grid.cols + col``; read once per scoring pass so the
+    inner loops never go through Cell attribute lookups.
+    """
+    return bytearray(cell.blocked for row in grid.cells for cell in row)
+
+
+def _calculate_corridor_width_score(pos: Position, grid: Grid, blocked: bytearray) -> float:
     """Calculate corridor width score (narrower = higher score).
     
     Args:
         pos: Position to score
         grid: Current grid
+        blocked: Snapshot from ``_snapshot_blocked`` for grid
         
     Returns:
         Score based on available exits (fewer exits = higher score)
     """
     # Count available (unblocked) neighbors
-    neighbors = _get_neighbors((pos.row, pos.col), grid.rows, grid.adjacency.allow_diagonal)
-    available_neighbors = sum(
-        1 for n in neighbors 
-        if not grid.get_cell(n).blocked
-    )
+    rows, cols = grid.rows, grid.cols
+    allow_diagonal = grid.adjacency.allow_diagonal
+    available_neighbors = 0
+    for dr, dc in (_DELTAS_8 if allow_diagonal else _DELTAS_4):
+        r, c = pos.row + dr, pos.col + dc
+        if 0 <= r < rows and 0 <= c < cols and not blocked[r * cols + c]:
+            available_neighbors += 1
     
     # Narrower corridor (fewer neighbors) = higher score
     # Use inverse: max_neighbors / (available + 1)
-    max_neighbors = 8 if grid.adjacency.allow_diagonal else 4
+    max_neighbors = 8 if allow_diagonal else 4
     score = max_neighbors / (available_neighbors + 1)
     
     return score
@@ -123,13 +260,17 @@ def _calculate_corridor_width_score(pos: Position, grid: Grid) -> float:
 
 def _calculate_distance_score(pos: Position, 
                               givens: List[Position], 
-                              grid_size: int) -> float:
+                              grid_size: int,
+                              distances: Optional[List[int]] = None,
+                              cols: Optional[int] = None) -> float:
     """Calculate distance from givens score (farther = higher score).
     
     Args:
         pos: Position to score
         givens: Given positions
         grid_size: Grid size (rows, assuming square)
+        distances: Optional precomputed ``manhattan_distance_field`` of givens
+        cols: Row stride of distances (defaults to grid_size)
         
     Returns:
         Score based on distance from nearest given (farther = higher)
@@ -138,10 +279,13 @@ def _calculate_distance_score(pos: Position,
         return 1.0  # No givens, all positions equally far
     
     # Find minimum Manhattan distance to any given
-    min_distance = min(
-        abs(pos.row - g.row) + abs(pos.col - g.col)
-        for g in givens
-    )
+    if distances is not None:
+        min_distance = distances[pos.row * (cols or grid_size) + pos.col]
+    else:
+        min_distance = min(
+            abs(pos.row - g.row) + abs(pos.col - g.col)
+            for g in givens
+        )
     
     # Normalize by grid size and add 1 to avoid zero
     max_distance = 2 * (grid_size - 1)  # Maximum possible Manhattan distance
@@ -150,17 +294,13 @@ def _calculate_distance_score(pos: Position,
     return normalized
 
 
-def _get_neighbors(pos: Tuple[int, int], size: int, allow_diagonal: bool) -> List[Position]:
-    """Get adjacent positions."""
+def _get_neighbors(pos: Tuple[int, int], rows: int, cols: int, allow_diagonal: bool) -> List[Position]:
+    """Get adjacent in-bounds positions."""
     neighbors = []
-    deltas = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-    
-    if allow_diagonal:
-        deltas += [(1, 1), (1, -1), (-1, 1), (-1, -1)]
     
-    for dr, dc in deltas:
+    for dr, dc in (_DELTAS_8 if allow_diagonal else _DELTAS_4):
         r, c = pos[0] + dr, pos[1] + dc
-        if 0 <= r < size and 0 <= c < size:
+        if 0 <= r < rows and 0 <= c < cols:
             neighbors.append(Position(r, c))
     
     return neighbors
@@ -3,10 +3,36 @@
 Contains functions for checking puzzle uniqueness during generation.
 """
 import time
+from collections import OrderedDict
+from dataclasses import replace
 from solve.solver import Solver
 from .models import UniquenessCheckResult
 from hidato_io.exporters import ascii_print
 
+# Completed (not timed-out) count_solutions results keyed by puzzle state and
+# search limits; LRU-bounded so long generation runs don't grow it unbounded
+_COUNT_CACHE = OrderedDict()
+_COUNT_CACHE_MAX = 256
+
+
+def _puzzle_key(puzzle):
+    """Canonical hashable snapshot of everything the solver reads from puzzle."""
+    grid = puzzle.grid
+    constraints = puzzle.constraints
+    value_set = getattr(constraints, 'value_set', None)
+    return (
+        grid.rows,
+        grid.cols,
+        grid.adjacency.allow_diagonal,
+        constraints.min_value,
+        constraints.max_value,
+        constraints.allow_diagonal,
+        constraints.must_be_connected,
+        frozenset(value_set) if value_set is not None else None,
+        tuple((cell.value, cell.blocked, cell.given) for row in grid.cells for cell in row),
+    )
+
+
 def count_solutions(puzzle, cap=2, node_cap=1000, timeout_ms=5000):
     """Count solutions up to a cap (early abort).
     
@@ -32,8 +58,30 @@ def count_solutions(puzzle, cap=2, node_cap=1000, timeout_ms=5000):
             - nodes: int
             - depth: int
             - elapsed_ms: int
+    
+    Searches that finish within their limits are deterministic, so their
+    results are memoized (LRU, 256 entries) by puzzle state and limits; a
+    repeat returns the stored counts with a fresh elapsed_ms. Timed-out
+    searches are never cached.
     """
-    import time
+    start_time = time.time()
+    key = (_puzzle_key(puzzle), cap, node_cap, timeout_ms)
+    
+    cached = _COUNT_CACHE.get(key)
+    if cached is not None:
+        _COUNT_CACHE.move_to_end(key)
+        return replace(cached, elapsed_ms=int((time.time() - start_time) * 1000))
+    
+    result, timed_out = _count_solutions_uncached(puzzle, cap, node_cap, timeout_ms)
+    if not timed_out:
+        _COUNT_CACHE[key] = replace(result)  # Callers may mutate what they get
+        if len(_COUNT_CACHE) > _COUNT_CACHE_MAX:
+            _COUNT_CACHE.popitem(last=False)
+    return result
+
+
+def _count_solutions_uncached(puzzle, cap, node_cap, timeout_ms):
+    """Run the solution count; returns (UniquenessCheckResult, timed_out)."""
     start_time = time.time()
     
     # For small puzzles (<=25 cells), use exhaustive search
@@ -56,7 +104,7 @@ def count_solutions(puzzle, cap=2, node_cap=1000, timeout_ms=5000):
             nodes=result['nodes'],
             depth=result['depth'],
             elapsed_ms=elapsed_ms
-        )
+        ), result['timed_out']
     
     # For larger puzzles, use count_solutions with higher limits
     # This is more expensive but necessary for true uniqueness verification
@@ -77,7 +125,7 @@ def count_solutions(puzzle, cap=2, node_cap=1000, timeout_ms=5000):
         nodes=result['nodes'],
         depth=result['depth'],
         elapsed_ms=elapsed_ms
-    )
+    ), result['timed_out']
 
 
 def verify_uniqueness(puzzle, node_cap=1000, timeout_ms=5000):
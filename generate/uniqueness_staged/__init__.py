@@ -124,8 +124,7 @@ def check_uniqueness(request: UniquenessCheckRequest) -> UniquenessCheckResult:
     
     logger = logging.getLogger(__name__)
     start_time = time.time()
-    per_stage_ms = {}
-    nodes_explored = {}
+    ms_early_exit = ms_probes = ms_sat = None
     probes_run = 0
     
     # Log configuration
@@ -160,7 +159,7 @@ def check_uniqueness(request: UniquenessCheckRequest) -> UniquenessCheckResult:
             )
             
             stage_elapsed = int((time.time() - stage_start) * 1000)
-            per_stage_ms['early_exit'] = stage_elapsed
+            ms_early_exit = stage_elapsed
             
             # If we found non-unique, return immediately
             if result is not None:
@@ -194,7 +193,7 @@ def check_uniqueness(request: UniquenessCheckRequest) -> UniquenessCheckResult:
             )
             
             stage_elapsed = int((time.time() - stage_start) * 1000)
-            per_stage_ms['probes'] = stage_elapsed
+            ms_probes = stage_elapsed
             
             # If we found non-unique, return immediately
             if result is not None:
@@ -228,7 +227,7 @@ def check_uniqueness(request: UniquenessCheckRequest) -> UniquenessCheckResult:
             )
             
             stage_elapsed = int((time.time() - stage_start) * 1000)
-            per_stage_ms['sat'] = stage_elapsed
+            ms_sat = stage_elapsed
             
             # SAT stage can return any decision (Unique/Non-Unique/Inconclusive)
             # If it reached a decision (not None), return it
@@ -241,15 +240,16 @@ def check_uniqueness(request: UniquenessCheckRequest) -> UniquenessCheckResult:
     # If no stage found non-unique, return inconclusive for now
     elapsed_ms = int((time.time() - start_time) * 1000)
     
-    logger.info(f"All stages completed: inconclusive after {elapsed_ms}ms "
-                f"(stages run: {list(per_stage_ms.keys())})")
-    
-    return UniquenessCheckResult(
+    result = UniquenessCheckResult(
         decision=UniquenessDecision.INCONCLUSIVE,
         stage_decided='all_stages_exhausted',
         elapsed_ms=elapsed_ms,
-        per_stage_ms=per_stage_ms,
-        nodes_explored=nodes_explored,
+        ms_early_exit=ms_early_exit,
+        ms_probes=ms_probes,
+        ms_sat=ms_sat,
         probes_run=probes_run,
-        notes=f'All enabled stages ran without finding second solution (stages: {list(per_stage_ms.keys())})'
     )
+    stages_run = list(result.per_stage_ms)
+    result.notes = f'All enabled stages ran without finding second solution (stages: {stages_run})'
+    logger.info(f"All stages completed: inconclusive after {elapsed_ms}ms (stages run: {stages_run})")
+    return result
@@ -79,8 +79,8 @@ def run_early_exit_stage(
                 decision=UniquenessDecision.NON_UNIQUE,
                 stage_decided='early_exit',
                 elapsed_ms=elapsed_ms,
-                per_stage_ms={'early_exit': elapsed_ms},
-                nodes_explored={'early_exit': total_nodes},
+                ms_early_exit=elapsed_ms,
+                nodes_early_exit=total_nodes,
                 probes_run=0,
                 notes=f'Found multiple solutions using profile {profile.id}'
             )
@@ -4,11 +4,11 @@ This stage performs multiple solver runs with randomized decision ordering,
 aiming to discover second solutions through diverse search paths.
 """
 
-import random
 import time
 from typing import Optional
 
 from generate.uniqueness_staged.result import UniquenessCheckResult, UniquenessDecision
+from util.rng import seeded_random
 
 
 def run_probes_stage(
@@ -37,8 +37,8 @@ def run_probes_stage(
     start_time = time.time()
     per_probe_budget = budget_ms // num_probes if num_probes > 0 else budget_ms
     
-    # Seed the RNG for deterministic probe generation
-    rng = random.Random(seed)
+    # Seed the RNG for deterministic probe generation (cached MT state per seed)
+    rng = seeded_random(seed)
     
     solutions_found = 0
     nodes_explored = 0
@@ -74,8 +74,8 @@ def run_probes_stage(
                     decision=UniquenessDecision.NON_UNIQUE,
                     stage_decided='probes',
                     elapsed_ms=elapsed_ms,
-                    per_stage_ms={'probes': elapsed_ms},
-                    nodes_explored={'probes': nodes_explored},
+                    ms_probes=elapsed_ms,
+                    nodes_probes=nodes_explored,
                     probes_run=probes_completed,
                     notes=f'Found {solutions_found} solutions via probes (probe {probe_idx+1}/{num_probes})'
                 )
@@ -126,5 +126,5 @@ def generate_probe_seeds(base_seed: int, num_probes: int) -> list[int]:
     Notes:
         Same base_seed always produces identical sequence (FR-013).
     """
-    rng = random.Random(base_seed)
+    rng = seeded_random(base_seed)
     return [rng.randint(0, 2**31 - 1) for _ in range(num_probes)]
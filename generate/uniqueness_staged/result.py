@@ -59,16 +59,23 @@ class UniquenessCheckRequest:
             raise ValueError(f"adjacency must be 4 or 8, got {self.adjacency}")
 
 
-@dataclass
+# Stage names in pipeline order; each has fixed ms_/nodes_ slots on the result
+STAGE_NAMES = ('early_exit', 'probes', 'sat')
+
+
+@dataclass(slots=True)
 class UniquenessCheckResult:
     """Result from uniqueness validation.
     
+    Per-stage metrics are fixed slots (None when the stage did not run or
+    report); per_stage_ms and nodes_explored rebuild the dict views on demand.
+    
     Attributes:
         decision: Unique, Non-Unique, or Inconclusive
         stage_decided: Name of stage that made the decision
         elapsed_ms: Total elapsed time
-        per_stage_ms: Time spent per stage
-        nodes_explored: Nodes explored per stage
+        ms_early_exit / ms_probes / ms_sat: Time spent per stage
+        nodes_early_exit / nodes_probes / nodes_sat: Nodes explored per stage
         probes_run: Number of probes executed
         notes: Additional context or reasons
     """
@@ -76,11 +83,32 @@ class UniquenessCheckResult:
     decision: UniquenessDecision
     stage_decided: str
     elapsed_ms: int
-    per_stage_ms: Dict[str, int] = field(default_factory=dict)
-    nodes_explored: Dict[str, int] = field(default_factory=dict)
+    ms_early_exit: Optional[int] = None
+    ms_probes: Optional[int] = None
+    ms_sat: Optional[int] = None
+    nodes_early_exit: Optional[int] = None
+    nodes_probes: Optional[int] = None
+    nodes_sat: Optional[int] = None
     probes_run: int = 0
     notes: str = ""
     
+    @property
+    def per_stage_ms(self) -> Dict[str, int]:
+        """Time spent per stage, for the stages that ran."""
+        stage_ms = (self.ms_early_exit, self.ms_probes, self.ms_sat)
+        return {name: ms for name, ms in zip(STAGE_NAMES, stage_ms) if ms is not None}
+    
+    @property
+    def nodes_explored(self) -> Dict[str, int]:
+        """Nodes explored per stage, for the stages that reported a count."""
+        stage_nodes = (self.nodes_early_exit, self.nodes_probes, self.nodes_sat)
+        return {name: n for name, n in zip(STAGE_NAMES, stage_nodes) if n is not None}
+    
+    @property
+    def total_nodes(self) -> int:
+        """Nodes explored across all stages."""
+        return sum(self.nodes_explored.values())
+    
     @property
     def is_unique(self) -> bool:
         """Convenience property for Unique decision."""
@@ -134,7 +162,7 @@ def aggregate_metrics(results: list[UniquenessCheckResult]) -> Dict[str, any]:
         return {}
     
     total_time = sum(r.elapsed_ms for r in results)
-    total_nodes = sum(sum(r.nodes_explored.values()) for r in results)
+    total_nodes = sum(r.total_nodes for r in results)
     total_probes = sum(r.probes_run for r in results)
     
     decisions = {
@@ -41,8 +41,7 @@ def run_sat_stage(
             decision=UniquenessDecision.INCONCLUSIVE,
             stage_decided='sat',
             elapsed_ms=0,
-            per_stage_ms={'sat': 0},
-            nodes_explored={},
+            ms_sat=0,
             probes_run=0,
             notes='SAT solver not registered'
         )
@@ -63,8 +62,7 @@ def run_sat_stage(
             decision=UniquenessDecision.INCONCLUSIVE,
             stage_decided='sat',
             elapsed_ms=elapsed_ms,
-            per_stage_ms={'sat': elapsed_ms},
-            nodes_explored={},
+            ms_sat=elapsed_ms,
             probes_run=0,
             notes='SAT solver could not find first solution within budget'
         )
@@ -84,8 +82,7 @@ def run_sat_stage(
             decision=UniquenessDecision.NON_UNIQUE,
             stage_decided='sat',
             elapsed_ms=elapsed_ms,
-            per_stage_ms={'sat': elapsed_ms},
-            nodes_explored={},
+            ms_sat=elapsed_ms,
             probes_run=0,
             notes='SAT solver found second solution via blocking clause'
         )
@@ -95,8 +92,7 @@ def run_sat_stage(
             decision=UniquenessDecision.UNIQUE,
             stage_decided='sat',
             elapsed_ms=elapsed_ms,
-            per_stage_ms={'sat': elapsed_ms},
-            nodes_explored={},
+            ms_sat=elapsed_ms,
             probes_run=0,
             notes='SAT solver verified uniqueness (no second solution found)'
         )
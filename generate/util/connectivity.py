@@ -3,24 +3,30 @@
 Used by both mask validation and repair clustering to avoid duplication.
 """
 from collections import deque
-from typing import List, Set, Tuple
+from typing import List, Optional, Sequence, Set, Tuple
 
 
-def get_neighbor_offsets(allow_diagonal: bool) -> List[Tuple[int, int]]:
+# Neighbour offsets per adjacency mode, built once at import
+_OFFSETS_8 = ((-1, -1), (-1, 0), (-1, 1),
+              (0, -1),           (0, 1),
+              (1, -1),  (1, 0),  (1, 1))
+_OFFSETS_4 = ((-1, 0), (0, -1), (0, 1), (1, 0))
+
+# "Forward" halves of the above (union is symmetric, so each pair is linked once)
+_FORWARD_8 = ((0, 1), (1, -1), (1, 0), (1, 1))
+_FORWARD_4 = ((0, 1), (1, 0))
+
+
+def get_neighbor_offsets(allow_diagonal: bool) -> Sequence[Tuple[int, int]]:
     """Get neighbor offsets based on adjacency mode.
     
     Args:
         allow_diagonal: Whether to include diagonal neighbors
         
     Returns:
-        List of (row_offset, col_offset) tuples
+        Shared (read-only) tuple of (row_offset, col_offset) pairs
     """
-    if allow_diagonal:
-        return [(-1, -1), (-1, 0), (-1, 1),
-                (0, -1),          (0, 1),
-                (1, -1),  (1, 0),  (1, 1)]
-    else:
-        return [(-1, 0), (0, -1), (0, 1), (1, 0)]
+    return _OFFSETS_8 if allow_diagonal else _OFFSETS_4
 
 
 def get_neighbors(pos: Tuple[int, int], size: int, allow_diagonal: bool) -> List[Tuple[int, int]]:
@@ -66,10 +72,11 @@ def bfs_reachable(start: Tuple[int, int],
     visited = {start}
     queue = deque([start])
     
+    offsets = _OFFSETS_8 if allow_diagonal else _OFFSETS_4
     while queue:
         r, c = queue.popleft()
         
-        for dr, dc in get_neighbor_offsets(allow_diagonal):
+        for dr, dc in offsets:
             nr, nc = r + dr, c + dc
             if 0 <= nr < size and 0 <= nc < size:
                 if (nr, nc) in valid_cells and (nr, nc) not in visited:
@@ -95,26 +102,96 @@ def find_connected_components(cells: Set[Tuple[int, int]],
     if not cells:
         return []
     
-    clusters = []
-    remaining = set(cells)
+    # Union-find over flat row-major indices (path halving + union by rank).
+    # In-bounds cells only look at their "forward" neighbours since union is
+    # symmetric; cells outside the size x size box get indices past n and only
+    # link to in-bounds neighbours, as the BFS neighbour lookup did.
+    n = size * size
+    outside = [cell for cell in cells if not (0 <= cell[0] < size and 0 <= cell[1] < size)]
+    parent = list(range(n + len(outside)))
+    rank = bytearray(len(parent))
+    member = bytearray(n)
+    inside = []
+    for r, c in cells:
+        if 0 <= r < size and 0 <= c < size:
+            member[r * size + c] = 1
+            inside.append((r, c))
     
-    while remaining:
-        # Start new cluster with arbitrary cell
-        seed = remaining.pop()
-        cluster = {seed}
-        frontier = deque([seed])
-        
-        # BFS to find all adjacent cells
-        while frontier:
-            current = frontier.popleft()
-            neighbors = get_neighbors(current, size, allow_diagonal)
-            
-            for neighbor in neighbors:
-                if neighbor in remaining:
-                    remaining.remove(neighbor)
-                    cluster.add(neighbor)
-                    frontier.append(neighbor)
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    def union(i: int, j: int) -> None:
+        ri, rj = find(i), find(j)
+        if ri == rj:
+            return
+        if rank[ri] < rank[rj]:
+            ri, rj = rj, ri
+        parent[rj] = ri
+        if rank[ri] == rank[rj]:
+            rank[ri] += 1
+    
+    forward = _FORWARD_8 if allow_diagonal else _FORWARD_4
+    for r, c in inside:
+        for dr, dc in forward:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < size and 0 <= nc < size and member[nr * size + nc]:
+                union(r * size + c, nr * size + nc)
+    
+    for k, (r, c) in enumerate(outside, start=n):
+        for nr, nc in get_neighbors((r, c), size, allow_diagonal):
+            if member[nr * size + nc]:
+                union(k, nr * size + nc)
+    
+    groups = {}
+    for r, c in inside:
+        groups.setdefault(find(r * size + c), set()).add((r, c))
+    for k, cell in enumerate(outside, start=n):
+        groups.setdefault(find(k), set()).add(cell)
+    
+    return list(groups.values())
+
+
+def manhattan_distance_field(sources, rows: int, cols: int) -> Optional[List[int]]:
+    """Manhattan distance from every cell to its nearest source.
+    
+    Multi-source BFS over the open rows x cols box (4-neighbour, ignoring
+    blocks), so each entry equals the min over sources of |dr| + |dc|.
+    
+    Args:
+        sources: Positions (anything with ``row``/``col``) to measure from
+        rows: Grid rows
+        cols: Grid columns
         
-        clusters.append(cluster)
+    Returns:
+        Flat row-major list (index row * cols + col), or None when there are
+        no sources or one lies outside the grid (callers then scan sources)
+    """
+    if not sources:
+        return None
+    
+    distances = [-1] * (rows * cols)
+    frontier = []
+    for pos in sources:
+        if not (0 <= pos.row < rows and 0 <= pos.col < cols):
+            return None
+        idx = pos.row * cols + pos.col
+        if distances[idx] < 0:
+            distances[idx] = 0
+            frontier.append((pos.row, pos.col))
+    
+    depth = 0
+    while frontier:
+        depth += 1
+        next_frontier = []
+        for r, c in frontier:
+            for dr, dc in _OFFSETS_4:
+                nr, nc = r + dr, c + dc
+                if 0 <= nr < rows and 0 <= nc < cols and distances[nr * cols + nc] < 0:
+                    distances[nr * cols + nc] = depth
+                    next_frontier.append((nr, nc))
+        frontier = next_frontier
     
-    return clusters
+    return distances
@@ -13,6 +13,10 @@ from hidato_io.exporters import ascii_print
 if TYPE_CHECKING:
     from solve.candidates import CandidateModel
 
+class _StopSearch(Exception):
+    """Unwinds count_solutions' recursion as soon as the solution cap is hit."""
+
+
 class SolverStep:
     """Represents a single solving step with explanation."""
     
@@ -221,6 +225,8 @@ class Solver:
             # Check if puzzle is complete
             if is_complete(puzzle_state):
                 solutions_found += 1
+                if solutions_found >= cap:
+                    raise _StopSearch()
                 return
             
             # Find next empty cell
@@ -238,10 +244,6 @@ class Solver:
             
             # Try each possible value (explore all branches)
             for value in possible_values:
-                # Early exit if we've found enough solutions
-                if solutions_found >= cap:
-                    return
-                
                 # Create new puzzle state with this assignment
                 temp_solver = Solver(puzzle_state)
                 new_puzzle = temp_solver._copy_puzzle(puzzle_state)
@@ -255,7 +257,10 @@ class Solver:
         solver = Solver(puzzle)
         new_puzzle = solver._copy_puzzle(puzzle)
         clear_nongivens(new_puzzle)
-        search_recursive(new_puzzle, 0)
+        try:
+            search_recursive(new_puzzle, 0)
+        except _StopSearch:
+            pass  # Cap reached; the answer can no longer change
 
         return {
             'solutions_found': solutions_found,
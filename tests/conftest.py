@@ -0,0 +1,29 @@
+"""Shared fixtures for the test suite."""
+import pytest
+
+from core.grid import Grid
+from tests.util.puzzle_factory import blank_puzzle
+
+
+@pytest.fixture(scope="session")
+def puzzle_cache():
+    """Session-wide store of generated puzzles (see tests.util.puzzle_cache)."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def grid_5x5_diag():
+    """Shared empty 5x5 grid with diagonal adjacency.
+    
+    Read-only: tests that block cells or run repair on it take ``.clone()``.
+    """
+    return Grid(5, 5, allow_diagonal=True)
+
+
+@pytest.fixture
+def puzzle_3x3_8():
+    """Fresh empty 3x3 puzzle (values 1..9, diagonal adjacency).
+    
+    Cloned from a cached blank template, so tests may mutate it freely.
+    """
+    return blank_puzzle(3, allow_diagonal=True)
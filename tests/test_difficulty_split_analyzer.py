@@ -0,0 +1,41 @@
+"""Tests for the difficulty split analyzer's score field reader."""
+import json
+
+import pytest
+
+from tools.difficulty_split_analyzer import _read_score_fields
+
+
+def _puzzle(difficulty, score):
+    return {
+        "id": "p0",
+        "difficulty": difficulty,
+        "difficulty_score_1": score,
+        # Nested keys of the same name must not be picked up
+        "metrics": {"difficulty": "nested", "difficulty_score_1": 99.0},
+    }
+
+
+# name -> (puzzle dict, json.dumps kwargs)
+READ_CASES = {
+    "indented": (_puzzle("classic", 0.42), dict(indent=2)),
+    "compact": (_puzzle("classic", 0.42), dict(separators=(",", ":"))),
+    "escaped": (_puzzle('cla"ss\\ic é', -1.5e-3), dict(indent=2)),
+    "escaped_unicode_raw": (_puzzle("expert é", 3), dict(indent=2, ensure_ascii=False)),
+    "null_score": (_puzzle("classic", None), dict(indent=2)),
+    "null_difficulty": (_puzzle(None, 0.5), dict(indent=2)),
+    "missing_fields": ({"id": "p0", "metrics": {"difficulty": "nested"}}, dict(indent=2)),
+}
+
+
+@pytest.mark.parametrize("case", list(READ_CASES))
+def test_read_score_fields_matches_json_load(tmp_path, case):
+    """Fast regex path and full-parse fallback both agree with json.load."""
+    data, dump_kwargs = READ_CASES[case]
+    path = tmp_path / "0000.json"
+    path.write_text(json.dumps(data, **dump_kwargs) + "\n", encoding="utf-8")
+    
+    with open(path, encoding="utf-8") as f:
+        expected = json.load(f)
+    
+    assert _read_score_fields(path) == (expected.get("difficulty"), expected.get("difficulty_score_1"))
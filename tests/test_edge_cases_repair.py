@@ -122,11 +122,11 @@ def test_score_empty_regions():
     assert len(candidates) == 0
 
 
-def test_score_region_all_blocked():
+def test_score_region_all_blocked(grid_5x5_diag):
     """T051: Region where all adjacent cells are blocked should have no candidates."""
     from generate.repair.models import AmbiguityRegion
     
-    grid = Grid(5, 5)
+    grid = grid_5x5_diag.clone()
     # Block cells around (2, 2)
     for r in range(1, 4):
         for c in range(1, 4):
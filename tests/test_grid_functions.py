@@ -32,6 +32,45 @@ def test_iter_cells():
     for cell, (r, c) in zip(grid.iter_cells(), positions):
         assert cell.pos.row == r
         assert cell.pos.col == c
+def test_set_blocked_cells():
+    grid = Grid(3, 3)
+    grid.set_blocked_cells([(0, 0), (2, 1)])
+    blocked = {(cell.pos.row, cell.pos.col) for cell in grid.iter_cells() if cell.blocked}
+    assert blocked == {(0, 0), (2, 1)}
+    try:
+        grid.set_blocked_cells([(3, 0)])
+        assert False, "Expected IndexError"
+    except IndexError:
+        pass
+def test_set_values():
+    grid = Grid(2, 2)
+    grid.set_values([(0, 1, 3), (1, 0, 4)])
+    assert [[cell.value for cell in row] for row in grid.cells] == [[None, 3], [4, None]]
+    grid.set_givens([(1, 1, 9)])
+    try:
+        grid.set_values([(1, 1, 5)])
+        assert False, "Expected ValueError"
+    except ValueError:
+        pass
+    assert grid.cells[1][1].value == 9
+def test_set_givens():
+    grid = Grid(3, 3)
+    grid.set_givens([(0, 0, 1), (2, 1, 8)])
+    givens = {(cell.pos.row, cell.pos.col): cell.value for cell in grid.iter_cells() if cell.given}
+    assert givens == {(0, 0): 1, (2, 1): 8}
+    try:
+        grid.set_givens([(0, 3, 2)])
+        assert False, "Expected IndexError"
+    except IndexError:
+        pass
+def test_neighbors_of_matches_adjacency_order():
+    for diagonal in (True, False):
+        grid = Grid(3, 3, allow_diagonal=diagonal)
+        grid.set_blocked_cells([(0, 1)])
+        for cell in grid.iter_cells():
+            expected = [Position(r, c) for r, c in grid.adjacency.get_neighbors(cell.pos)
+                        if 0 <= r < 3 and 0 <= c < 3 and (r, c) != (0, 1)]
+            assert grid.neighbors_of(cell.pos) == expected
 def test_empty_and_filled_positions():
     grid = Grid(2, 2)
     grid.set_cell_value(Position(0, 0), 1)
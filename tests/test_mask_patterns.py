@@ -2,9 +2,6 @@
 import pytest
 from generate.mask.patterns import (
     generate_corridor_pattern,
-    generate_ring_pattern,
-    generate_spiral_pattern,
-    generate_cross_pattern,
     get_pattern_generator,
     get_pattern_constraints,
     PATTERNS
@@ -12,58 +9,45 @@ from generate.mask.patterns import (
 from util.rng import RNG
 
 
-def test_corridor_pattern_basic():
-    """T016: Verify corridor pattern generates valid mask."""
-    rng = RNG(1234)
-    mask = generate_corridor_pattern(size=7, rng=rng, seed=1234, attempt_idx=0)
-    
-    assert mask.grid_size == 7
-    assert mask.pattern_id == "corridor"
-    assert mask.seed == 1234
-    assert len(mask.cells) > 0
-    assert mask.density == len(mask.cells) / 49
-
-
-def test_ring_pattern_basic():
-    """T016: Verify ring pattern generates valid mask."""
-    rng = RNG(5678)
-    mask = generate_ring_pattern(size=7, rng=rng, seed=5678, attempt_idx=0)
-    
-    assert mask.grid_size == 7
-    assert mask.pattern_id == "ring"
-    assert len(mask.cells) > 0
-    assert mask.density <= 0.11  # Allow small tolerance
+@pytest.fixture(scope="session")
+def pattern_mask_cache():
+    """Session-wide store of generated pattern masks keyed by (name, size, seed)."""
+    return {}
 
 
-def test_spiral_pattern_basic():
-    """T016: Verify spiral pattern generates valid mask."""
-    rng = RNG(9999)
-    mask = generate_spiral_pattern(size=8, rng=rng, seed=9999, attempt_idx=0)
-    
-    assert mask.grid_size == 8
-    assert mask.pattern_id == "spiral"
-    assert len(mask.cells) > 0
+def _gen(cache, name, size, seed):
+    """Generate (or reuse) the pattern mask for a fresh RNG(seed)."""
+    key = (name, size, seed)
+    if key not in cache:
+        cache[key] = get_pattern_generator(name)(size, RNG(seed), seed, 0)
+    return cache[key]
 
 
-def test_cross_pattern_basic():
-    """T016: Verify cross pattern generates valid mask."""
-    rng = RNG(1111)
-    mask = generate_cross_pattern(size=7, rng=rng, seed=1111, attempt_idx=0)
+@pytest.mark.parametrize("name,size,seed,max_density", [
+    ("corridor", 7, 1234, 0.12),
+    ("ring", 7, 5678, 0.11),  # Allow small tolerance
+    ("spiral", 8, 9999, 0.12),
+    ("cross", 7, 1111, 0.12),
+])
+def test_pattern_basic(pattern_mask_cache, name, size, seed, max_density):
+    """T016: Verify each pattern generates a valid mask."""
+    mask = _gen(pattern_mask_cache, name, size, seed)
     
-    assert mask.grid_size == 7
-    assert mask.pattern_id == "cross"
+    assert mask.grid_size == size
+    assert mask.pattern_id == name
+    assert mask.seed == seed
     assert len(mask.cells) > 0
+    assert mask.density == len(mask.cells) / (size * size)
+    assert mask.density <= max_density
 
 
-def test_pattern_deterministic():
+def test_pattern_deterministic(pattern_mask_cache):
     """T016: Verify same seed produces same pattern."""
     seed = 4242
     
-    rng1 = RNG(seed)
-    mask1 = generate_corridor_pattern(size=7, rng=rng1, seed=seed, attempt_idx=0)
-    
-    rng2 = RNG(seed)
-    mask2 = generate_corridor_pattern(size=7, rng=rng2, seed=seed, attempt_idx=0)
+    mask1 = _gen(pattern_mask_cache, "corridor", 7, seed)
+    # Fresh generation (not a cache hit) so determinism is actually exercised
+    mask2 = generate_corridor_pattern(size=7, rng=RNG(seed), seed=seed, attempt_idx=0)
     
     assert mask1.cells == mask2.cells
     assert mask1.density == mask2.density
@@ -99,14 +83,11 @@ def test_all_patterns_registered():
         assert "max_density" in PATTERNS[pattern_name]
 
 
-def test_patterns_respect_density_cap():
+def test_patterns_respect_density_cap(pattern_mask_cache):
     """T016: Verify patterns stay near 10% density target (12% cap for discrete cells)."""
-    rng = RNG(7777)
-    
     for size in [7, 8, 9]:
         for pattern_name in ["corridor", "ring", "spiral", "cross"]:
-            gen = get_pattern_generator(pattern_name)
-            mask = gen(size, rng, 7777, 0)
+            mask = _gen(pattern_mask_cache, pattern_name, size, 7777)
             
             # Real cap is 10%, but discrete cell counts on small boards → 12% tolerance
             assert mask.density <= 0.12, f"{pattern_name} on {size}x{size} density {mask.density} > 0.12"
@@ -0,0 +1,70 @@
+"""Tests for the metrics explorer's pack loading and parquet cache.
+
+The app needs its optional UI stack, so the module is skipped without it.
+"""
+import json
+import os
+
+import pytest
+
+pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+pytest.importorskip("streamlit")
+pytest.importorskip("plotly")
+
+from tools.metrics_explorer import app  # noqa: E402
+
+
+def _write_puzzle(puzzles_dir, name, puzzle_id, score):
+    data = {
+        "id": puzzle_id,
+        "size": 5,
+        "difficulty": "classic",
+        "difficulty_score_1": score,
+        "metrics": {"solver": {"nodes": 10, "depth": 2}, "timings_ms": {"total": 5.0}},
+    }
+    path = puzzles_dir / name
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def pack(tmp_path):
+    pack_dir = tmp_path / "pack"
+    puzzles_dir = pack_dir / "puzzles"
+    puzzles_dir.mkdir(parents=True)
+    (pack_dir / "metadata.json").write_text(json.dumps({"title": "test"}), encoding="utf-8")
+    for i in range(3):
+        _write_puzzle(puzzles_dir, f"{i:04d}.json", f"p{i}", 0.1 * i)
+    return pack_dir
+
+
+def test_load_pack_reuses_cache_until_files_change(pack, tmp_path):
+    cache_dir = tmp_path / "cache"
+    puzzles_dir = pack / "puzzles"
+
+    _, first, _ = app._load_pack(str(pack), cache_dir)
+    cached = list(cache_dir.glob("*.parquet"))
+    assert len(cached) == 1
+    assert not list(pack.glob(".*"))  # nothing written into the pack itself
+
+    _, second, lookup = app._load_pack(str(pack), cache_dir)
+    assert second.equals(first)
+    assert lookup.get("p1")["difficulty_score_1"] == 0.1
+
+    # A rename keeps count and mtimes but must still invalidate
+    os.rename(puzzles_dir / "0001.json", puzzles_dir / "0009.json")
+    _, _, lookup = app._load_pack(str(pack), cache_dir)
+    assert lookup.get("p1")["id"] == "p1"
+    assert list(cache_dir.glob("*.parquet")) != cached
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+    # Swap one file for another with an older mtime: same count, same newest mtime
+    newest = max(p.stat().st_mtime_ns for p in puzzles_dir.glob("*.json"))
+    (puzzles_dir / "0002.json").unlink()
+    added = _write_puzzle(puzzles_dir, "0005.json", "p5", 0.5)
+    os.utime(added, ns=(newest - 10**9, newest - 10**9))
+    _, frame, lookup = app._load_pack(str(pack), cache_dir)
+    assert sorted(frame["puzzle_id"]) == ["p0", "p1", "p5"]
+    assert lookup.get("p5")["difficulty_score_1"] == 0.5
+    assert lookup.get("p2") is None
@@ -6,50 +6,43 @@ import pytest
 from generate.mask.metrics import MaskGenerationMetrics
 
 
-def test_mask_metrics_instantiation():
-    """T040: MaskGenerationMetrics can be instantiated."""
-    metrics = MaskGenerationMetrics()
-    
-    assert metrics.pattern_id is None
-    assert metrics.cells_count == 0
-    assert metrics.density == 0.0
-    assert metrics.attempts == 0
-    assert metrics.validation_time_ms == 0
-    assert metrics.selected is False
-
-
-def test_mask_metrics_with_values():
+MASK_DEFAULTS = [
+    ("pattern_id", None),
+    ("cells_count", 0),
+    ("density", 0.0),
+    ("attempts", 0),
+    ("validation_time_ms", 0),
+    ("selected", False),
+]
+
+MASK_ROUNDTRIP = [
+    dict(pattern_id="corridor", cells_count=5, density=0.05, attempts=2,
+         validation_time_ms=10, selected=True),
+    dict(density=0.08),
+    dict(cells_count=10, attempts=3),
+]
+
+
+@pytest.mark.parametrize("field,expected", MASK_DEFAULTS)
+def test_mask_metrics_default(field, expected):
+    """T040: MaskGenerationMetrics can be instantiated with defaults."""
+    assert getattr(MaskGenerationMetrics(), field) == expected
+
+
+@pytest.mark.parametrize("kwargs", MASK_ROUNDTRIP)
+def test_mask_metrics_roundtrip(kwargs):
     """T040: MaskGenerationMetrics stores values correctly."""
-    metrics = MaskGenerationMetrics(
-        pattern_id="corridor",
-        cells_count=5,
-        density=0.05,
-        attempts=2,
-        validation_time_ms=10,
-        selected=True
-    )
+    metrics = MaskGenerationMetrics(**kwargs)
     
-    assert metrics.pattern_id == "corridor"
-    assert metrics.cells_count == 5
-    assert metrics.density == 0.05
-    assert metrics.attempts == 2
-    assert metrics.validation_time_ms == 10
-    assert metrics.selected is True
+    for field, value in kwargs.items():
+        assert getattr(metrics, field) == value
 
 
-def test_mask_metrics_density_range():
-    """T040: Mask density should be within valid range."""
-    metrics = MaskGenerationMetrics(density=0.08)
+@pytest.mark.parametrize("kwargs", [{}] + MASK_ROUNDTRIP)
+def test_mask_metrics_invariants(kwargs):
+    """T040: Mask density within valid range and counts non-negative."""
+    metrics = MaskGenerationMetrics(**kwargs)
     
     assert 0.0 <= metrics.density <= 0.10
-
-
-def test_mask_metrics_counts_positive():
-    """T040: Mask metrics counts should be non-negative."""
-    metrics = MaskGenerationMetrics(
-        cells_count=10,
-        attempts=3
-    )
-    
     assert metrics.cells_count >= 0
     assert metrics.attempts >= 0
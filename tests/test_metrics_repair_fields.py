@@ -6,38 +6,51 @@ import pytest
 from generate.repair.metrics import RepairMetrics
 
 
-def test_repair_metrics_instantiation():
+REPAIR_DEFAULTS = [
+    ("enabled", False),
+    ("attempts", 0),
+    ("structural_blocks_applied", 0),
+    ("clue_fallbacks_used", 0),
+    ("ambiguity_regions_detected", 0),
+    ("uniqueness_restored", False),
+    ("repair_time_ms", 0.0),
+]
+
+REPAIR_ROUNDTRIP = [
+    dict(enabled=True, attempts=3, structural_blocks_applied=2, clue_fallbacks_used=1,
+         ambiguity_regions_detected=2, uniqueness_restored=True, repair_time_ms=150.5),
+    dict(attempts=5, structural_blocks_applied=3, clue_fallbacks_used=2,
+         ambiguity_regions_detected=4),
+    dict(repair_time_ms=250.0),
+    dict(enabled=False),
+]
+
+
+@pytest.mark.parametrize("field,expected", REPAIR_DEFAULTS)
+def test_repair_metrics_default(field, expected):
     """T041: RepairMetrics can be instantiated with defaults."""
-    metrics = RepairMetrics()
-    
-    assert metrics.enabled is False
-    assert metrics.attempts == 0
-    assert metrics.structural_blocks_applied == 0
-    assert metrics.clue_fallbacks_used == 0
-    assert metrics.ambiguity_regions_detected == 0
-    assert metrics.uniqueness_restored is False
-    assert metrics.repair_time_ms == 0.0
+    assert getattr(RepairMetrics(), field) == expected
 
 
-def test_repair_metrics_with_values():
+@pytest.mark.parametrize("kwargs", REPAIR_ROUNDTRIP)
+def test_repair_metrics_roundtrip(kwargs):
     """T041: RepairMetrics stores values correctly."""
-    metrics = RepairMetrics(
-        enabled=True,
-        attempts=3,
-        structural_blocks_applied=2,
-        clue_fallbacks_used=1,
-        ambiguity_regions_detected=2,
-        uniqueness_restored=True,
-        repair_time_ms=150.5
-    )
+    metrics = RepairMetrics(**kwargs)
+    
+    for field, value in kwargs.items():
+        assert getattr(metrics, field) == value
+
+
+@pytest.mark.parametrize("kwargs", [{}] + REPAIR_ROUNDTRIP)
+def test_repair_metrics_invariants(kwargs):
+    """T041: Repair counts and time are non-negative."""
+    metrics = RepairMetrics(**kwargs)
     
-    assert metrics.enabled is True
-    assert metrics.attempts == 3
-    assert metrics.structural_blocks_applied == 2
-    assert metrics.clue_fallbacks_used == 1
-    assert metrics.ambiguity_regions_detected == 2
-    assert metrics.uniqueness_restored is True
-    assert metrics.repair_time_ms == 150.5
+    assert metrics.attempts >= 0
+    assert metrics.structural_blocks_applied >= 0
+    assert metrics.clue_fallbacks_used >= 0
+    assert metrics.ambiguity_regions_detected >= 0
+    assert metrics.repair_time_ms >= 0.0
 
 
 def test_repair_metrics_blocks_and_fallbacks_sum():
@@ -51,28 +64,6 @@ def test_repair_metrics_blocks_and_fallbacks_sum():
     assert total_repairs == 3
 
 
-def test_repair_metrics_counts_non_negative():
-    """T041: All repair counts should be non-negative."""
-    metrics = RepairMetrics(
-        attempts=5,
-        structural_blocks_applied=3,
-        clue_fallbacks_used=2,
-        ambiguity_regions_detected=4
-    )
-    
-    assert metrics.attempts >= 0
-    assert metrics.structural_blocks_applied >= 0
-    assert metrics.clue_fallbacks_used >= 0
-    assert metrics.ambiguity_regions_detected >= 0
-
-
-def test_repair_metrics_time_positive():
-    """T041: Repair time should be non-negative."""
-    metrics = RepairMetrics(repair_time_ms=250.0)
-    
-    assert metrics.repair_time_ms >= 0.0
-
-
 def test_repair_metrics_disabled_state():
     """T041: When disabled, no repairs should be applied."""
     metrics = RepairMetrics(enabled=False)
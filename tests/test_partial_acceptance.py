@@ -1,30 +1,11 @@
 """Test partial path acceptance (T037-T039)."""
 import pytest
-from generate.generator import Generator
+from tests.util.puzzle_cache import get_puzzle
 
 
-class TestPartialAcceptance:
-    """Test partial coverage acceptance with blocked cells."""
+class TestGenerationConfig:
+    """Config validation for partial acceptance (no generation needed)."""
     
-    def test_partial_acceptance_blocks_remainder(self):
-        """When partial path accepted, remainder cells are blocked."""
-        # Note: Since our current path modes always achieve 100% coverage,
-        # this test documents the expected behavior when partial acceptance is triggered
-        
-        # Generate with standard mode (should be 100% coverage)
-        result = Generator.generate_puzzle(
-            size=5,
-            difficulty="easy",
-            seed=42,
-            allow_diagonal=True,
-            path_mode="serpentine",
-            allow_partial_paths=True,
-            min_cover_ratio=0.85
-        )
-        
-        # Should have full solution (no partial acceptance needed)
-        assert len(result.solution) == 25
-        
     def test_min_cover_ratio_validation(self):
         """Config validates min_cover_ratio range."""
         from generate.models import GenerationConfig
@@ -67,6 +48,10 @@ class TestPartialAcceptance:
         # Invalid
         with pytest.raises(ValueError, match="path_time_ms"):
             GenerationConfig(size=5, path_time_ms=50)  # Too low
+
+
+class TestPartialAcceptance:
+    """Test partial coverage acceptance with blocked cells."""
     
     def test_path_build_result_structure(self):
         """PathBuildResult returns expected structure."""
@@ -97,9 +82,29 @@ class TestPartialAcceptance:
 class TestPartialAcceptanceIntegration:
     """Integration tests for partial path acceptance."""
     
-    def test_generation_with_partial_paths_enabled(self):
+    @pytest.mark.parametrize("seed,min_cover_ratio", [(42, 0.85), (123, 0.95)])
+    def test_serpentine_5x5_full_coverage(self, puzzle_cache, seed, min_cover_ratio):
+        """Serpentine always completes, so partial acceptance is never needed."""
+        # Note: Since our current path modes always achieve 100% coverage,
+        # this documents the expected behavior when partial acceptance is enabled
+        result = get_puzzle(
+            puzzle_cache,
+            size=5,
+            difficulty="easy",
+            seed=seed,
+            allow_diagonal=True,
+            path_mode="serpentine",
+            allow_partial_paths=True,
+            min_cover_ratio=min_cover_ratio
+        )
+        
+        # Should have full solution (no partial acceptance needed)
+        assert len(result.solution) == 25
+    
+    def test_generation_with_partial_paths_enabled(self, puzzle_cache):
         """Generation works with allow_partial_paths=True."""
-        result = Generator.generate_puzzle(
+        result = get_puzzle(
+            puzzle_cache,
             size=6,
             difficulty="medium",
             seed=99,
@@ -112,17 +117,3 @@ class TestPartialAcceptanceIntegration:
         assert result.size == 6
         assert result.uniqueness_verified
         assert len(result.solution) >= 29  # At least 80% of 36
-    
-    def test_generation_with_tight_coverage_threshold(self):
-        """High min_cover_ratio still allows generation."""
-        result = Generator.generate_puzzle(
-            size=5,
-            difficulty="easy",
-            seed=123,
-            path_mode="serpentine",
-            allow_partial_paths=True,
-            min_cover_ratio=0.95
-        )
-        
-        # Should achieve full coverage with serpentine
-        assert len(result.solution) == 25
@@ -2,6 +2,7 @@
 
 T18: Unit tests for interval reduction, ordering, and state management.
 """
+import copy
 import pytest
 from core.position import Position
 from core.cell import Cell
@@ -11,6 +12,7 @@ from core.puzzle import Puzzle
 from generate.pruning import (
     order_removable_clues,
     contract_interval,
+    contract_interval_into,
     should_fallback_to_linear,
     IntervalState,
     PruningSession,
@@ -18,36 +20,46 @@ from generate.pruning import (
 )
 
 
+def _make_linear_puzzle(path, given=True):
+    """Build a 1xN puzzle laid out along path, every cell valued in order."""
+    cells = [Cell._fast(pos, i + 1, False, given) for i, pos in enumerate(path)]
+    grid = Grid(1, len(path), cells, allow_diagonal=False)
+    return Puzzle(grid, Constraints(1, len(path), "4"))
+
+
+# Shared read-only 1xN paths (Position is never mutated by these tests)
+PATH_5 = tuple(Position(0, i) for i in range(5))
+PATH_7 = tuple(Position(0, i) for i in range(7))
+
+
+@pytest.fixture(scope="module")
+def linear_puzzle_5():
+    """All-given 1x5 puzzle shared by the module; deepcopy before mutating."""
+    return _make_linear_puzzle(PATH_5)
+
+
+@pytest.fixture(scope="module")
+def linear_puzzle_7():
+    """All-given 1x7 puzzle shared by the module; deepcopy before mutating."""
+    return _make_linear_puzzle(PATH_7)
+
+
 class TestClueOrdering:
     """Test removable clue ordering heuristic (T01)."""
     
-    def test_order_removable_clues_excludes_endpoints(self):
+    def test_order_removable_clues_excludes_endpoints(self, linear_puzzle_5):
         """Endpoints must never be in removable list."""
-        path = [Position(0, i) for i in range(5)]
-        cells = []
-        for i, pos in enumerate(path):
-            cells.append(Cell(pos, i + 1, False, True))  # All givens
-        
-        grid = Grid(1, 5, cells, allow_diagonal=False)
-        puzzle = Puzzle(grid, Constraints(1, 5, "4"))
+        path = PATH_5
         
-        removable = order_removable_clues(puzzle, path)
+        removable = order_removable_clues(linear_puzzle_5, path)
         
         assert path[0] not in removable
         assert path[-1] not in removable
         assert len(removable) == 3
     
-    def test_order_removable_clues_central_first(self):
+    def test_order_removable_clues_central_first(self, linear_puzzle_7):
         """Central clues scored higher for removal than edge clues."""
-        path = [Position(0, i) for i in range(7)]
-        cells = []
-        for i, pos in enumerate(path):
-            cells.append(Cell(pos, i + 1, False, True))
-        
-        grid = Grid(1, 7, cells, allow_diagonal=False)
-        puzzle = Puzzle(grid, Constraints(1, 7, "4"))
-        
-        removable = order_removable_clues(puzzle, path)
+        removable = order_removable_clues(linear_puzzle_7, PATH_7)
         
         # Central position (0,3) should be first
         assert removable[0] == Position(0, 3)
@@ -61,18 +73,10 @@ class TestClueOrdering:
         
         assert removable == []
     
-    def test_order_removable_clues_deterministic(self):
+    def test_order_removable_clues_deterministic(self, linear_puzzle_5):
         """Same puzzle/path produces identical ordering."""
-        path = [Position(0, i) for i in range(5)]
-        cells = []
-        for i, pos in enumerate(path):
-            cells.append(Cell(pos, i + 1, False, True))
-        
-        grid = Grid(1, 5, cells, allow_diagonal=False)
-        puzzle = Puzzle(grid, Constraints(1, 5, "4"))
-        
-        removable1 = order_removable_clues(puzzle, path)
-        removable2 = order_removable_clues(puzzle, path)
+        removable1 = order_removable_clues(linear_puzzle_5, PATH_5)
+        removable2 = order_removable_clues(linear_puzzle_5, PATH_5)
         
         assert removable1 == removable2
 
@@ -106,6 +110,18 @@ class TestIntervalContraction:
                 break
         
         assert low >= high - 1
+    
+    def test_contract_interval_into_reuses_state(self):
+        """In-place contraction matches contract_interval on the same object."""
+        state = IntervalState(0, 10)
+        
+        assert contract_interval_into(state, "uniqueness_fail") is state
+        assert (state.low_index, state.high_index) == (0, 4)
+        
+        contract_interval_into(state, "density_met")
+        expected = contract_interval(0, 4, "density_met")
+        assert (state.low_index, state.high_index) == (expected.low_index, expected.high_index)
+        assert state.contraction_reason == "density_met"
 
 
 class TestLinearFallback:
@@ -136,28 +152,18 @@ class TestPruningSession:
         assert session.interval_contractions == 0
         assert session.timeout_occurred is False
     
-    def test_pruning_session_record_iteration(self):
-        """Iteration recording increments counter."""
+    @pytest.mark.parametrize("method,attr,expected", [
+        ("record_iteration", "iteration_count", 2),
+        ("record_uniqueness_failure", "uniqueness_failures", 1),
+        ("record_repair", "repairs_used", 2),
+    ])
+    def test_pruning_session_record_counter(self, method, attr, expected):
+        """Each record_* call increments its counter."""
         session = PruningSession()
-        session.record_iteration()
-        session.record_iteration()
+        for _ in range(expected):
+            getattr(session, method)()
         
-        assert session.iteration_count == 2
-    
-    def test_pruning_session_record_uniqueness_failure(self):
-        """Uniqueness failure recording increments counter."""
-        session = PruningSession()
-        session.record_uniqueness_failure()
-        
-        assert session.uniqueness_failures == 1
-    
-    def test_pruning_session_record_repair(self):
-        """Repair recording increments counter."""
-        session = PruningSession()
-        session.record_repair()
-        session.record_repair()
-        
-        assert session.repairs_used == 2
+        assert getattr(session, attr) == expected
     
     def test_pruning_session_record_interval_contraction(self):
         """Contraction recording stores history."""
@@ -193,27 +199,22 @@ class TestPruningStatus:
     
     def test_status_enum_values(self):
         """All expected status values present."""
-        assert PruningStatus.SUCCESS.value == "success"
-        assert PruningStatus.SUCCESS_WITH_REPAIRS.value == "success_with_repairs"
-        assert PruningStatus.ABORTED_MAX_REPAIRS.value == "aborted_max_repairs"
-        assert PruningStatus.ABORTED_TIMEOUT.value == "aborted_timeout"
+        assert PruningStatus.SUCCESS.label == "success"
+        assert PruningStatus.SUCCESS_WITH_REPAIRS.label == "success_with_repairs"
+        assert PruningStatus.ABORTED_MAX_REPAIRS.label == "aborted_max_repairs"
+        assert PruningStatus.ABORTED_TIMEOUT.label == "aborted_timeout"
 
 
 class TestRepairLogic:
     """Test repair candidate selection and application (T05-T08)."""
     
-    def test_sample_alternate_solutions(self):
+    def test_sample_alternate_solutions(self, linear_puzzle_5):
         """Sample alternates returns valid solutions."""
         from generate.pruning import sample_alternate_solutions
         
-        # Create simple puzzle
-        path = [Position(0, i) for i in range(5)]
-        cells = []
-        for i, pos in enumerate(path):
-            cells.append(Cell(pos, i + 1, False, True))
-        
-        grid = Grid(1, 5, cells, allow_diagonal=False)
-        puzzle = Puzzle(grid, Constraints(1, 5, "4"))
+        # Copy the shared puzzle since this test mutates givens
+        path = PATH_5
+        puzzle = copy.deepcopy(linear_puzzle_5)
         
         # Remove some givens to create non-unique puzzle
         puzzle.grid.get_cell(Position(0, 2)).given = False
@@ -229,7 +230,7 @@ class TestRepairLogic:
         """Build profile from alternates."""
         from generate.pruning import build_ambiguity_profile
         
-        path = [Position(0, i) for i in range(5)]
+        path = PATH_5
         givens = {path[0], path[4]}
         
         # Mock alternates with divergence at position (0,2)
@@ -267,14 +268,81 @@ class TestRepairLogic:
         from generate.pruning import apply_repair_clue, RepairCandidate
         
         path = [Position(0, i) for i in range(3)]
-        cells = []
-        for i, pos in enumerate(path):
-            cells.append(Cell(pos, i + 1, False, False))  # Not given
-        
-        grid = Grid(1, 3, cells, allow_diagonal=False)
-        puzzle = Puzzle(grid, Constraints(1, 3, "4"))
+        puzzle = _make_linear_puzzle(path, given=False)  # Not given
         
         candidate = RepairCandidate(Position(0, 1), "test", 1.0)
         apply_repair_clue(puzzle, candidate)
         
         assert puzzle.grid.get_cell(Position(0, 1)).given is True
+
+
+class TestGivenClusters:
+    """Test given-cell cluster detection used by dechunking."""
+    
+    def test_find_given_clusters_respects_adjacency_and_blocks(self):
+        """Diagonal touches join clusters only in 8-neighbour mode; blocked givens are skipped."""
+        from generate.pruning import _find_given_clusters
+        
+        grid = Grid(3, 3, allow_diagonal=True)
+        puzzle = Puzzle(grid, Constraints(1, 9, "8"))
+        for r, c in [(0, 0), (1, 1), (2, 2), (0, 2)]:
+            cell = grid.cells[r][c]
+            cell.given = True
+            cell.value = r * 3 + c + 1
+        grid.cells[2][2].blocked = True
+        
+        clusters_8 = _find_given_clusters(puzzle, allow_diagonal=True)
+        assert [sorted((p.row, p.col) for p in cl) for cl in clusters_8] == [[(0, 0), (0, 2), (1, 1)]]
+        
+        clusters_4 = _find_given_clusters(puzzle, allow_diagonal=False)
+        assert [[(p.row, p.col) for p in cl] for cl in clusters_4] == [[(0, 0)], [(0, 2)], [(1, 1)]]
+
+
+class TestGuardHelpers:
+    """Test structural guard helpers against their direct definitions."""
+    
+    def test_flex_zone_matches_per_cell_rescore(self):
+        """Flex zone = empty cells whose blocking leaves the ambiguity score unchanged."""
+        from generate.pruning import _compute_flex_zone_size, _estimate_ambiguity_score
+        
+        grid = Grid(5, 5, allow_diagonal=True)
+        puzzle = Puzzle(grid, Constraints(1, 25, "8"))
+        for (r, c), value in {(0, 0): 1, (0, 4): 5, (2, 2): 13, (4, 0): 21, (4, 4): 25}.items():
+            cell = grid.cells[r][c]
+            cell.value = value
+            cell.given = True
+        # 1 is left with exactly two empty neighbours, (1, 0) and (1, 1)
+        grid.cells[0][1].blocked = True
+        
+        baseline = _estimate_ambiguity_score(puzzle)
+        expected = 0
+        for cell in grid.iter_cells():
+            if cell.blocked or cell.given:
+                continue
+            cell.blocked = True
+            expected += _estimate_ambiguity_score(puzzle) == baseline
+            cell.blocked = False
+        
+        assert _compute_flex_zone_size(puzzle) == expected
+        assert expected == 25 - 6 - 2  # All empty cells but the two critical ones
+    
+    def test_anchor_guards_accept_shared_given_values(self):
+        """Dispersion and head/tail guards agree whether or not given values are passed in."""
+        from generate.pruning import (
+            _compute_anchor_dispersion,
+            _detect_high_value_tail,
+            _detect_low_value_head,
+            _sorted_given_values,
+        )
+        
+        grid = Grid(3, 3, allow_diagonal=True)
+        puzzle = Puzzle(grid, Constraints(1, 9, "8"))
+        grid.set_givens([(2, 2, 9), (0, 0, 1), (0, 1, 2), (1, 2, 6), (2, 1, 8)])
+        grid.cells[1][1].blocked = True
+        
+        given_values = _sorted_given_values(puzzle)
+        assert given_values == [1, 2, 6, 8, 9]
+        
+        assert _compute_anchor_dispersion(puzzle, given_values) == _compute_anchor_dispersion(puzzle) == 3
+        assert _detect_low_value_head(puzzle, given_values) == _detect_low_value_head(puzzle) == (2, 2)
+        assert _detect_high_value_tail(puzzle, given_values) == _detect_high_value_tail(puzzle) == (2, 8)
@@ -2,9 +2,36 @@
 
 Verify that identical seeds produce identical results.
 """
+import copy
+from functools import lru_cache
+
 import pytest
 from generate.generator import Generator
 from generate.pruning import compute_pruning_hash
+from core.position import Position
+from tests.util.puzzle_cache import get_puzzle
+
+# Shared read-only 1x5 path
+PATH_5 = tuple(Position(0, i) for i in range(5))
+
+
+@lru_cache(maxsize=None)
+def _cached_linear_puzzle(length, givens_at):
+    """Build (once) a 1xN puzzle with givens at the given path indices.
+
+    Returned puzzles are shared; deepcopy before mutating cells.
+    """
+    from core.position import Position
+    from core.cell import Cell
+    from core.grid import Grid
+    from core.constraints import Constraints
+    from core.puzzle import Puzzle
+    
+    gset = set(givens_at)
+    cells = [Cell._fast(Position(0, i), i + 1, False, i in gset) for i in range(length)]
+    
+    grid = Grid(1, length, cells, allow_diagonal=False)
+    return Puzzle(grid, Constraints(1, length, "4"))
 
 
 class TestDeterminism:
@@ -12,17 +39,11 @@ class TestDeterminism:
     
     def test_pruning_hash_stability(self):
         """Same givens produce same hash."""
-        from core.position import Position
-        from core.cell import Cell
-        from core.grid import Grid
-        from core.constraints import Constraints
-        from core.puzzle import Puzzle
-        
-        # Create identical puzzles
-        path = [Position(0, i) for i in range(5)]
+        # Create identical puzzles (distinct objects, same content)
+        path = PATH_5
         
         puzzle1 = self._make_puzzle(path, givens_at=[0, 2, 4])
-        puzzle2 = self._make_puzzle(path, givens_at=[0, 2, 4])
+        puzzle2 = copy.deepcopy(puzzle1)
         
         hash1 = compute_pruning_hash(puzzle1, path, "easy")
         hash2 = compute_pruning_hash(puzzle2, path, "easy")
@@ -31,9 +52,7 @@ class TestDeterminism:
     
     def test_pruning_hash_differs_on_change(self):
         """Different givens produce different hashes."""
-        from core.position import Position
-        
-        path = [Position(0, i) for i in range(5)]
+        path = PATH_5
         
         puzzle1 = self._make_puzzle(path, givens_at=[0, 2, 4])
         puzzle2 = self._make_puzzle(path, givens_at=[0, 1, 4])  # Different
@@ -43,44 +62,27 @@ class TestDeterminism:
         
         assert hash1 != hash2
     
-    def test_generator_determinism_with_pruning_disabled(self):
+    def test_generator_determinism_with_pruning_disabled(self, puzzle_cache):
         """Same seed produces same puzzle (legacy mode)."""
-        seed = 12345
-        
-        result1 = Generator.generate_puzzle(
+        kwargs = dict(
             size=5,
             difficulty="easy",
-            seed=seed,
+            seed=12345,
             allow_diagonal=True,
             path_mode="serpentine"
         )
         
-        result2 = Generator.generate_puzzle(
-            size=5,
-            difficulty="easy", 
-            seed=seed,
-            allow_diagonal=True,
-            path_mode="serpentine"
-        )
+        # Shared session result plus one fresh generation to compare against
+        result1 = get_puzzle(puzzle_cache, **kwargs)
+        result2 = Generator.generate_puzzle(**kwargs)
         
         # Should have same givens
-        assert sorted(result1.givens) == sorted(result2.givens)
+        assert set(result1.givens) == set(result2.givens)
         assert result1.clue_count == result2.clue_count
     
     def _make_puzzle(self, path, givens_at):
-        """Helper to create puzzle with specific givens."""
-        from core.cell import Cell
-        from core.grid import Grid
-        from core.constraints import Constraints
-        from core.puzzle import Puzzle
-        
-        cells = []
-        for i, pos in enumerate(path):
-            is_given = i in givens_at
-            cells.append(Cell(pos, i + 1, False, is_given))
-        
-        grid = Grid(1, len(path), cells, allow_diagonal=False)
-        return Puzzle(grid, Constraints(1, len(path), "4"))
+        """Helper to create puzzle with specific givens (memoized, read-only)."""
+        return _cached_linear_puzzle(len(path), tuple(givens_at))
 
 
 class TestTimeout:
@@ -1,7 +1,8 @@
 """Test that pruning.py actually uses the new staged checker."""
 
+import os
 import sys
-sys.path.insert(0, '.')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for script runs
 
 from core.grid import Grid
 from core.puzzle import Puzzle
@@ -9,20 +10,26 @@ from core.constraints import Constraints
 from generate.pruning import check_puzzle_uniqueness
 
 
+def _make_puzzle(size, allow_diagonal, givens):
+    """Build a size x size puzzle with {(row, col): value} givens."""
+    grid = Grid(rows=size, cols=size, allow_diagonal=allow_diagonal)
+    constraints = Constraints(min_value=1, max_value=size * size, allow_diagonal=allow_diagonal)
+    puzzle = Puzzle(grid=grid, constraints=constraints)
+    
+    for (r, c), value in givens.items():
+        cell = puzzle.grid.cells[r][c]
+        cell.value = value
+        cell.given = True
+    return puzzle
+
+
 def test_pruning_integration():
     """Test that check_puzzle_uniqueness uses the new method."""
     print("Testing pruning.py integration...")
     print("=" * 60)
     
     # Create simple 3x3 puzzle with 2 givens (likely non-unique)
-    grid = Grid(rows=3, cols=3, allow_diagonal=False)
-    constraints = Constraints(min_value=1, max_value=9, allow_diagonal=False)
-    puzzle = Puzzle(grid=grid, constraints=constraints)
-    
-    puzzle.grid.cells[0][0].value = 1
-    puzzle.grid.cells[0][0].given = True
-    puzzle.grid.cells[2][2].value = 9
-    puzzle.grid.cells[2][2].given = True
+    puzzle = _make_puzzle(3, False, {(0, 0): 1, (2, 2): 9})
     
     print(f"Test puzzle: 3x3 with 2 givens (corners)")
     print(f"Expected: NON-UNIQUE (too few givens)")
@@ -42,25 +49,14 @@ def test_pruning_with_more_givens():
     print("Testing with more givens...")
     print("=" * 60)
     
-    grid = Grid(rows=4, cols=4, allow_diagonal=True)
-    constraints = Constraints(min_value=1, max_value=16, allow_diagonal=True)
-    puzzle = Puzzle(grid=grid, constraints=constraints)
-    
     # Place several givens to constrain the puzzle
-    puzzle.grid.cells[0][0].value = 1
-    puzzle.grid.cells[0][0].given = True
-    
-    puzzle.grid.cells[1][1].value = 7
-    puzzle.grid.cells[1][1].given = True
-    
-    puzzle.grid.cells[2][2].value = 11
-    puzzle.grid.cells[2][2].given = True
-    
-    puzzle.grid.cells[3][3].value = 16
-    puzzle.grid.cells[3][3].given = True
-    
-    puzzle.grid.cells[1][2].value = 8
-    puzzle.grid.cells[1][2].given = True
+    puzzle = _make_puzzle(4, True, {
+        (0, 0): 1,
+        (1, 1): 7,
+        (2, 2): 11,
+        (3, 3): 16,
+        (1, 2): 8,
+    })
     
     print(f"Test puzzle: 4x4 with 5 givens")
     
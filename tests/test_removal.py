@@ -0,0 +1,37 @@
+"""Tests for clue removal scoring."""
+import random
+
+from core.grid import Grid
+from core.position import Position
+from generate.removal import score_candidates
+from generate.util.connectivity import manhattan_distance_field
+
+
+def test_distance_field_matches_manhattan_scan():
+    """Distance field should equal the min Manhattan distance to any anchor."""
+    rng = random.Random(7)
+    rows, cols = 6, 9
+    anchors = {Position(rng.randrange(rows), rng.randrange(cols)) for _ in range(4)}
+    
+    distances = manhattan_distance_field(anchors, rows, cols)
+    for r in range(rows):
+        for c in range(cols):
+            expected = min(abs(r - a.row) + abs(c - a.col) for a in anchors)
+            assert distances[r * cols + c] == expected
+    
+    assert manhattan_distance_field(set(), rows, cols) is None
+
+
+def test_score_candidates_skips_anchors_and_sorts():
+    """Anchors are never candidates; scores come back highest first."""
+    grid = Grid(5, 5)
+    anchors = {Position(0, 0), Position(4, 4)}
+    givens = anchors | {Position(2, 2), Position(0, 1), Position(3, 1)}
+    
+    candidates = score_candidates(givens, [], anchors, grid)
+    
+    assert {pos for pos, _ in candidates} == givens - anchors
+    scores = [score for _, score in candidates]
+    assert scores == sorted(scores, reverse=True)
+    # (2, 2) is farthest from both anchors
+    assert candidates[0][0] == Position(2, 2)
@@ -145,6 +145,20 @@ def test_diff_no_diagonal_adjacency():
     assert len(regions) == 2
 
 
+def test_diff_u_shaped_divergence_single_region():
+    """T029: Arms of a U-shaped divergence that only meet at the bottom form one region."""
+    from generate.repair.diff import diff_solutions
+    
+    solution1 = [(r, c, r * 3 + c + 1) for r in range(3) for c in range(3)]
+    u_cells = {(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)}
+    solution2 = [(r, c, v + 10 if (r, c) in u_cells else v) for r, c, v in solution1]
+    
+    regions = diff_solutions(solution1, solution2, size=3, allow_diagonal=False)
+    
+    assert len(regions) == 1
+    assert regions[0].cells == u_cells
+
+
 def test_ambiguity_region_properties():
     """T029: AmbiguityRegion should have correct properties."""
     cells = {(1, 1), (1, 2), (2, 1)}
@@ -173,3 +187,19 @@ def test_diff_multiple_solutions():
     # Cell (0,1) should have higher frequency (appears in 2/3 divergences)
     region = regions[0]
     assert region.divergence_count >= 2
+
+
+def test_diff_multiple_min_divergence_filters_cells():
+    """Cells below min_divergence are left out of every region."""
+    from generate.repair.diff import diff_multiple_solutions
+    
+    solutions = [
+        [(0, 0, 1), (0, 1, 2)],
+        [(0, 0, 2), (0, 1, 1)],  # Diverges at both
+        [(0, 0, 1), (0, 1, 1)],  # Diverges at (0,1)
+    ]
+    
+    # (0,0) disagrees in 2 of 3 pairs, (0,1) in 2 of 3 as well; require all 3
+    assert diff_multiple_solutions(solutions, size=2, min_divergence=3) == []
+    regions = diff_multiple_solutions(solutions, size=2, min_divergence=2)
+    assert sum(len(r.cells) for r in regions) == 2
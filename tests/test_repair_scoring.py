@@ -53,11 +53,11 @@ def test_score_frequency_impact():
         assert max_high > max_low
 
 
-def test_score_corridor_width_impact():
+def test_score_corridor_width_impact(grid_5x5_diag):
     """T030: Narrower corridors should yield higher scores."""
     from generate.repair.scoring import score_structural_blocks
     
-    grid = Grid(5, 5, allow_diagonal=True)
+    grid = grid_5x5_diag.clone()
     
     # Narrow corridor: region at (2, 2) with few exits
     grid.get_cell(Position(1, 2)).blocked = True
@@ -67,7 +67,7 @@ def test_score_corridor_width_impact():
     region_narrow = AmbiguityRegion(cells={(2, 2)}, divergence_count=2)
     
     # Wide corridor: region at interior with many exits
-    grid2 = Grid(5, 5, allow_diagonal=True)
+    grid2 = grid_5x5_diag
     region_wide = AmbiguityRegion(cells={(2, 2)}, divergence_count=2)
     
     candidates_narrow = score_structural_blocks([region_narrow], grid, [])
@@ -81,11 +81,11 @@ def test_score_corridor_width_impact():
         assert avg_narrow > avg_wide
 
 
-def test_score_distance_from_givens():
+def test_score_distance_from_givens(grid_5x5_diag):
     """T030: Positions farther from givens should score higher."""
     from generate.repair.scoring import score_structural_blocks
     
-    grid = Grid(5, 5, allow_diagonal=True)
+    grid = grid_5x5_diag
     region = AmbiguityRegion(
         cells={(2, 0), (2, 4)},
         divergence_count=2
@@ -155,11 +155,11 @@ def test_score_multiple_regions():
     assert has_region1 and has_region2
 
 
-def test_score_sorted_descending():
+def test_score_sorted_descending(grid_5x5_diag):
     """T030: Candidates should be sorted by score (highest first)."""
     from generate.repair.scoring import score_structural_blocks
     
-    grid = Grid(5, 5, allow_diagonal=True)
+    grid = grid_5x5_diag
     region = AmbiguityRegion(
         cells={(2, 1), (2, 2), (2, 3)},
         divergence_count=3
@@ -202,3 +202,144 @@ def test_score_adjacent_to_ambiguity():
     ]
     found_adjacent = [pos for pos in adjacent if pos in candidate_positions]
     assert len(found_adjacent) > 0
+
+
+def test_region_cells_mask_roundtrip():
+    """AmbiguityRegion should derive cells_mask from cells and vice versa."""
+    from generate.repair.models import pack
+    
+    region = AmbiguityRegion(cells={(1, 1), (2, 3)}, divergence_count=2)
+    assert region.cells_mask == pack(1, 1) | pack(2, 3)
+    
+    from_mask = AmbiguityRegion(cells_mask=pack(1, 1) | pack(2, 3), divergence_count=2)
+    assert from_mask.cells == {(1, 1), (2, 3)}
+    
+    # Regions outside the 8x8 packing range keep the set representation only
+    large = AmbiguityRegion(cells={(8, 8)}, divergence_count=2)
+    assert large.cells_mask == 0
+
+
+def test_region_cells_expanded_lazily_from_mask():
+    """Mask-only regions build their cell set on first access."""
+    from generate.repair.models import pack
+    
+    region = AmbiguityRegion(cells_mask=pack(0, 1) | pack(3, 2), divergence_count=2)
+    assert region._cells is None
+    assert (3, 2) in region.cells
+    assert region._cells == {(0, 1), (3, 2)}
+    
+    # The expanded view is as read-only as the mask it came from
+    assert isinstance(region.cells, frozenset)
+    with pytest.raises(AttributeError):
+        region.cells.discard((0, 1))
+    assert region.cells_mask == pack(0, 1) | pack(3, 2)
+
+
+def test_region_is_immutable():
+    """Cells and mask cannot drift apart after construction."""
+    import dataclasses
+    from generate.repair.models import pack
+    
+    region = AmbiguityRegion(cells={(1, 1)}, divergence_count=2)
+    assert isinstance(region.cells, frozenset)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        region.cells = {(2, 2)}
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        region.cells_mask = pack(2, 2)
+    with pytest.raises(AttributeError):
+        region.cells.add((2, 2))
+    
+    # An empty region is still valid
+    empty = AmbiguityRegion(cells=set())
+    assert empty.cells == frozenset() and empty.cells_mask == 0
+
+
+def test_score_masked_matches_set_path(grid_5x5_diag):
+    """Bitmask candidate search should match the set-based search."""
+    from generate.repair.scoring import (
+        _get_adjacent_candidates, _get_adjacent_candidates_masked
+    )
+    
+    grid = grid_5x5_diag.clone()
+    grid.get_cell(Position(0, 2)).blocked = True
+    region = AmbiguityRegion(cells={(1, 1), (1, 2), (2, 2)}, divergence_count=2)
+    givens = [Position(0, 0), Position(3, 3)]
+    
+    expected = set(_get_adjacent_candidates(region.cells, grid, givens))
+    actual = set(_get_adjacent_candidates_masked(region.cells_mask, grid, givens))
+    assert actual == expected
+
+
+def test_candidates_on_non_square_grid():
+    """Candidate search and corridor scoring index the blocked snapshot by cols."""
+    from generate.repair.scoring import (
+        _calculate_corridor_width_score, _get_adjacent_candidates,
+        _get_adjacent_candidates_masked, _snapshot_blocked
+    )
+    
+    grid = Grid(3, 6, allow_diagonal=True)
+    grid.get_cell(Position(0, 5)).blocked = True
+    grid.get_cell(Position(2, 4)).blocked = True
+    blocked = _snapshot_blocked(grid)
+    region = AmbiguityRegion(cells={(1, 4), (1, 5)}, divergence_count=2)
+    givens = [Position(0, 3)]
+    
+    candidates = set(_get_adjacent_candidates(region.cells, grid, givens, blocked))
+    assert candidates == {Position(0, 4), Position(1, 3), Position(2, 3), Position(2, 5)}
+    assert set(_get_adjacent_candidates_masked(region.cells_mask, grid, givens, blocked)) == candidates
+    
+    # (1, 5): 5 in-bounds neighbours, 2 of them blocked
+    assert _calculate_corridor_width_score(Position(1, 5), grid, blocked) == 8 / 4
+
+
+def test_distance_field_matches_manhattan_scan():
+    """Precomputed distance field should give the same scores as the direct scan."""
+    from generate.repair.scoring import _calculate_distance_score
+    from generate.util.connectivity import manhattan_distance_field
+    
+    givens = [Position(0, 0), Position(4, 1), Position(2, 4)]
+    distances = manhattan_distance_field(givens, 5, 5)
+    
+    for r in range(5):
+        for c in range(5):
+            pos = Position(r, c)
+            assert (_calculate_distance_score(pos, givens, 5, distances)
+                    == _calculate_distance_score(pos, givens, 5))
+
+
+def test_snapshot_blocked_is_row_major():
+    """Blocked snapshot is a flat row-major buffer of the grid's flags."""
+    from generate.repair.scoring import _snapshot_blocked
+    
+    grid = Grid(3, 3, allow_diagonal=True)
+    grid.get_cell(Position(0, 2)).blocked = True
+    grid.get_cell(Position(2, 1)).blocked = True
+    
+    blocked = _snapshot_blocked(grid)
+    assert len(blocked) == 9
+    assert [i for i, b in enumerate(blocked) if b] == [0 * 3 + 2, 2 * 3 + 1]
+
+
+def test_iter_structural_blocks_matches_sorted_order(grid_5x5_diag):
+    """Lazy best-first iteration yields the same sequence as the sorted list."""
+    from generate.repair.scoring import score_structural_blocks, iter_structural_blocks
+    
+    grid = grid_5x5_diag.clone()
+    grid.get_cell(Position(1, 3)).blocked = True
+    regions = [
+        AmbiguityRegion(cells={(1, 1), (1, 2)}, divergence_count=3),
+        AmbiguityRegion(cells={(3, 3)}, divergence_count=5),
+    ]
+    givens = [Position(0, 0), Position(4, 4)]
+    
+    expected = score_structural_blocks(regions, grid, givens)
+    assert list(iter_structural_blocks(regions, grid, givens)) == expected
+
+
+def test_grid_clone_is_independent(grid_5x5_diag):
+    """Blocking a cell on a clone leaves the shared template untouched."""
+    grid = grid_5x5_diag.clone()
+    grid.get_cell(Position(2, 2)).blocked = True
+    
+    assert not grid_5x5_diag.get_cell(Position(2, 2)).blocked
+    assert grid.adjacency.allow_diagonal and (grid.rows, grid.cols) == (5, 5)
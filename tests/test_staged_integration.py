@@ -3,12 +3,12 @@
 Tests the complete pipeline with different configurations.
 """
 
+import logging
+import os
 import sys
-sys.path.insert(0, '.')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))  # repo root, for script runs
 
-from core.grid import Grid
-from core.puzzle import Puzzle
-from core.constraints import Constraints
+from tests.util.puzzle_factory import blank_puzzle
 from generate.uniqueness_staged import (
     create_request,
     check_uniqueness,
@@ -20,13 +20,14 @@ from generate.uniqueness_staged import (
 )
 
 
+log = logging.getLogger(__name__)
+
+
 def test_create_request_helper():
     """Test the create_request helper function."""
-    print("\n=== Test: create_request helper ===")
+    log.debug("\n=== Test: create_request helper ===")
     
-    grid = Grid(rows=7, cols=7, allow_diagonal=True)
-    constraints = Constraints(min_value=1, max_value=49, allow_diagonal=True)
-    puzzle = Puzzle(grid=grid, constraints=constraints)
+    puzzle = blank_puzzle(7, allow_diagonal=True)
     
     # Test with defaults
     request = create_request(
@@ -44,7 +45,7 @@ def test_create_request_helper():
     assert request.strategy_flags['probes'] == True
     assert request.strategy_flags['sat'] == False
     
-    print("✓ create_request works with defaults")
+    log.debug("✓ create_request works with defaults")
     
     # Test with custom stage flags
     request2 = create_request(
@@ -57,16 +58,14 @@ def test_create_request_helper():
     assert request2.strategy_flags['early_exit'] == False
     assert request2.strategy_flags['sat'] == True
     
-    print("✓ create_request respects custom stage flags")
+    log.debug("✓ create_request respects custom stage flags")
 
 
 def test_enable_disable_stages():
     """Test programmatic API for stage control."""
-    print("\n=== Test: enable/disable stages ===")
+    log.debug("\n=== Test: enable/disable stages ===")
     
-    grid = Grid(rows=7, cols=7, allow_diagonal=True)
-    constraints = Constraints(min_value=1, max_value=49, allow_diagonal=True)
-    puzzle = Puzzle(grid=grid, constraints=constraints)
+    puzzle = blank_puzzle(7, allow_diagonal=True)
     
     request = create_request(puzzle=puzzle, size=7)
     
@@ -81,7 +80,7 @@ def test_enable_disable_stages():
     enable_stage(request, 'sat')
     assert request.strategy_flags['sat'] == True
     
-    print("✓ enable_stage and disable_stage work correctly")
+    log.debug("✓ enable_stage and disable_stage work correctly")
     
     # Test error handling
     try:
@@ -89,12 +88,12 @@ def test_enable_disable_stages():
         assert False, "Should raise ValueError"
     except ValueError as e:
         assert 'Unknown stage' in str(e)
-        print("✓ Raises error for invalid stage name")
+        log.debug("✓ Raises error for invalid stage name")
 
 
 def test_config_validation():
     """Test UniquenessConfig validation."""
-    print("\n=== Test: config validation ===")
+    log.debug("\n=== Test: config validation ===")
     
     # Test from_difficulty factory
     config = UniquenessConfig.from_difficulty(size=7, difficulty='easy', seed=123)
@@ -102,38 +101,31 @@ def test_config_validation():
     assert config.difficulty == 'easy'
     assert config.seed == 123
     
-    print("✓ from_difficulty creates correct config")
+    log.debug("✓ from_difficulty creates correct config")
     
     # Test small board budget
     config_small = UniquenessConfig.from_difficulty(size=5, difficulty='hard')
     assert config_small.total_budget_ms == 100  # Small board override
     
-    print("✓ Small board gets 100ms budget")
+    log.debug("✓ Small board gets 100ms budget")
     
     # Test validate_budget_allocation
     config.validate_budget_allocation()
-    print("✓ Budget validation passes for default config")
+    log.debug("✓ Budget validation passes for default config")
     
     # Test get_stage_budget
     early_budget = config.get_stage_budget('early_exit')
     assert early_budget == int(600 * 0.4)  # 40% of 600ms
     
-    print("✓ get_stage_budget calculates correctly")
+    log.debug("✓ get_stage_budget calculates correctly")
 
 
 def test_end_to_end_pipeline():
     """Test complete pipeline with a 7x7 puzzle."""
-    print("\n=== Test: end-to-end pipeline ===")
-    
-    grid = Grid(rows=7, cols=7, allow_diagonal=True)
-    constraints = Constraints(min_value=1, max_value=49, allow_diagonal=True)
-    puzzle = Puzzle(grid=grid, constraints=constraints)
+    log.debug("\n=== Test: end-to-end pipeline ===")
     
     # Add a few givens
-    puzzle.grid.cells[0][0].value = 1
-    puzzle.grid.cells[0][0].given = True
-    puzzle.grid.cells[6][6].value = 49
-    puzzle.grid.cells[6][6].given = True
+    puzzle = blank_puzzle(7, allow_diagonal=True, givens={(0, 0): 1, (6, 6): 49})
     
     # Run with all stages enabled (but SAT will be skipped - no solver)
     request = create_request(
@@ -154,27 +146,26 @@ def test_end_to_end_pipeline():
     assert result.elapsed_ms >= 0
     assert isinstance(result.per_stage_ms, dict)
     assert isinstance(result.nodes_explored, dict)
+    assert result.total_nodes == sum(result.nodes_explored.values())
     assert result.probes_run >= 0
     
-    print(f"✓ Pipeline completed: decision={result.decision.value}")
-    print(f"  Stage decided: {result.stage_decided}")
-    print(f"  Time: {result.elapsed_ms}ms")
-    print(f"  Per-stage: {result.per_stage_ms}")
+    log.debug(f"✓ Pipeline completed: decision={result.decision.value}")
+    log.debug(f"  Stage decided: {result.stage_decided}")
+    log.debug(f"  Time: {result.elapsed_ms}ms")
+    log.debug(f"  Per-stage: {result.per_stage_ms}")
     
     # Since early_exit and probes return None (placeholder search), should be inconclusive
     assert result.decision == UniquenessDecision.INCONCLUSIVE
     assert 'stages_exhausted' in result.stage_decided or 'placeholder' in result.stage_decided
     
-    print("✓ Returns inconclusive when all stages inconclusive")
+    log.debug("✓ Returns inconclusive when all stages inconclusive")
 
 
 def test_budget_enforcement():
     """Test that stages respect budget limits."""
-    print("\n=== Test: budget enforcement ===")
+    log.debug("\n=== Test: budget enforcement ===")
     
-    grid = Grid(rows=7, cols=7, allow_diagonal=True)
-    constraints = Constraints(min_value=1, max_value=49, allow_diagonal=True)
-    puzzle = Puzzle(grid=grid, constraints=constraints)
+    puzzle = blank_puzzle(7, allow_diagonal=True)
     
     # Use very small budget
     request = UniquenessCheckRequest(
@@ -191,18 +182,14 @@ def test_budget_enforcement():
     # Should complete within budget (even with overhead)
     assert result.elapsed_ms <= 100  # Allow some overhead
     
-    print(f"✓ Completed within budget: {result.elapsed_ms}ms <= 100ms")
+    log.debug(f"✓ Completed within budget: {result.elapsed_ms}ms <= 100ms")
 
 
 def test_determinism():
     """Test that same seed produces identical results."""
-    print("\n=== Test: determinism ===")
+    log.debug("\n=== Test: determinism ===")
     
-    grid = Grid(rows=7, cols=7, allow_diagonal=True)
-    constraints = Constraints(min_value=1, max_value=49, allow_diagonal=True)
-    puzzle = Puzzle(grid=grid, constraints=constraints)
-    puzzle.grid.cells[0][0].value = 1
-    puzzle.grid.cells[0][0].given = True
+    puzzle = blank_puzzle(7, allow_diagonal=True, givens={(0, 0): 1})
     
     # Run twice with same seed
     request1 = create_request(puzzle=puzzle, size=7, seed=42)
@@ -215,11 +202,15 @@ def test_determinism():
     assert result1.decision == result2.decision
     assert result1.stage_decided == result2.stage_decided
     
-    print("✓ Same seed produces identical decisions")
+    log.debug("✓ Same seed produces identical decisions")
 
 
 def main():
     """Run all integration tests."""
+    # Surface the per-test diagnostics, which pytest keeps out of stdout
+    logging.basicConfig(format="%(message)s")
+    log.setLevel(logging.DEBUG)
+    
     print("=" * 60)
     print("Staged Uniqueness Validation - Integration Tests")
     print("=" * 60)
@@ -0,0 +1,13 @@
+"""Determinism tests for the staged uniqueness probe stage."""
+import random
+
+from generate.uniqueness_staged.probes import generate_probe_seeds
+
+
+def test_probe_seeds_stable_across_cached_rng():
+    """Probe seeds for a base seed stay the random.Random sequence on repeat calls."""
+    expected = random.Random(42)
+    expected_seeds = [expected.randint(0, 2**31 - 1) for _ in range(5)]
+    
+    assert generate_probe_seeds(42, 5) == expected_seeds
+    assert generate_probe_seeds(42, 5) == expected_seeds
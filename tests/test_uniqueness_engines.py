@@ -25,19 +25,20 @@ def make_ambiguous_3x3(diagonal: bool = True) -> Puzzle:
     return Puzzle(grid, constraints)
 
 
-def make_unique_3x3(diagonal: bool = True) -> Puzzle:
-    size = 3
-    grid = Grid(size, size, allow_diagonal=diagonal)
-    # Serpentine path values 1..9
-    order = [
+# Serpentine path values 1..9 as (row, col, value) givens, built once
+_UNIQUE_3X3_GIVENS = tuple(
+    (r, c, v) for v, (r, c) in enumerate([
         (0, 0), (0, 1), (0, 2),
         (1, 2), (1, 1), (1, 0),
         (2, 0), (2, 1), (2, 2),
-    ]
-    for v, (r, c) in enumerate(order, start=1):
-        cell = grid.get_cell(Position(r, c))
-        cell.given = True
-        cell.value = v
+    ], start=1)
+)
+
+
+def make_unique_3x3(diagonal: bool = True) -> Puzzle:
+    size = 3
+    grid = Grid(size, size, allow_diagonal=diagonal)
+    grid.set_givens(_UNIQUE_3X3_GIVENS)
     constraints = Constraints(min_value=1, max_value=9, allow_diagonal=diagonal, must_be_connected=True)
     return Puzzle(grid, constraints)
 
@@ -88,3 +89,48 @@ def test_unique_3x3_unique():
 
     # High-level pipeline must confirm unique (staged + fallback if needed)
     assert check_puzzle_uniqueness(p, solver_mode="logic_v2") is True
+
+
+def test_check_puzzle_uniqueness_returns_solution(monkeypatch):
+    """The fallback path surfaces a sampled solution; the default call returns a bare bool."""
+    import generate.uniqueness_staged as staged
+    from generate.uniqueness_staged import UniquenessCheckResult
+
+    # A decisive staged answer never samples a solution, so force the fallback
+    monkeypatch.setattr(staged, "check_uniqueness", lambda request: UniquenessCheckResult(
+        decision=UniquenessDecision.INCONCLUSIVE, stage_decided="none", elapsed_ms=0,
+    ))
+    p = make_unique_3x3(diagonal=True)
+
+    is_unique, solution = check_puzzle_uniqueness(p, solver_mode="logic_v2", return_solution=True)
+    assert is_unique is True
+    assert solution is not None
+    assert sorted(solution.values()) == list(range(1, 10))
+    for cell in p.grid.iter_cells():
+        assert solution[cell.pos] == cell.value  # every cell is a given here
+    by_value = {value: pos for pos, value in solution.items()}
+    for value in range(1, 9):
+        a, b = by_value[value], by_value[value + 1]
+        assert max(abs(a.row - b.row), abs(a.col - b.col)) == 1
+
+    # Without return_solution the result is just the verdict, no solution attached
+    assert check_puzzle_uniqueness(p, solver_mode="logic_v2", return_solution=False) is True
+
+
+def test_count_solutions_memoizes_completed_searches():
+    """Repeat counts on an identical puzzle state are served from the cache."""
+    from generate import uniqueness
+
+    uniqueness._COUNT_CACHE.clear()
+    first = count_solutions(make_ambiguous_3x3(diagonal=True), cap=3, node_cap=10000, timeout_ms=2000)
+    assert len(uniqueness._COUNT_CACHE) == 1
+
+    # A separately built but identical puzzle hits the same entry
+    second = count_solutions(make_ambiguous_3x3(diagonal=True), cap=3, node_cap=10000, timeout_ms=2000)
+    assert len(uniqueness._COUNT_CACHE) == 1
+    assert (second.solutions_found, second.is_unique, second.nodes) == (first.solutions_found, first.is_unique, first.nodes)
+
+    # Different adjacency or limits are different keys
+    count_solutions(make_ambiguous_3x3(diagonal=False), cap=3, node_cap=10000, timeout_ms=2000)
+    count_solutions(make_ambiguous_3x3(diagonal=True), cap=2, node_cap=10000, timeout_ms=2000)
+    assert len(uniqueness._COUNT_CACHE) == 3
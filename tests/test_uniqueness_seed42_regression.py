@@ -7,24 +7,35 @@ Ensures the previously problematic configuration is now structurally sound:
 - Good spatial dispersion
 - Uniqueness confirmed by pipeline
 """
+from bisect import bisect_left
+
+import pytest
+
 from core.grid import Grid
-from core.position import Position
 from core.puzzle import Puzzle
 from core.constraints import Constraints
 
-from generate.generator import Generator
 from generate.pruning import _compute_anchor_dispersion, check_puzzle_uniqueness
+from tests.util.puzzle_cache import get_puzzle
+
+# Every test here shares a 9x9 hard generation
+pytestmark = pytest.mark.slow
+
+SEED42_HARD_KWARGS = dict(
+    size=9,
+    difficulty="hard",
+    path_mode="backbite_v1",
+    seed=42,
+    allow_diagonal=True,
+    structural_repair_enabled=False,
+)
 
 
 def _build_puzzle_from_generated(gp):
     size = gp.size
     grid = Grid(size, size, allow_diagonal=gp.allow_diagonal)
-    for r, c in gp.blocked_cells:
-        grid.get_cell(Position(r, c)).blocked = True
-    for r, c, v in gp.givens:
-        cell = grid.get_cell(Position(r, c))
-        cell.value = v
-        cell.given = True
+    grid.set_blocked_cells(gp.blocked_cells)
+    grid.set_givens(gp.givens)
     constraints = Constraints(
         min_value=1,
         max_value=len(gp.solution),
@@ -34,47 +45,54 @@ def _build_puzzle_from_generated(gp):
     return Puzzle(grid, constraints)
 
 
-def test_seed42_hard_backbite_v1_is_reasonable_and_unique():
-    gp = Generator.generate_puzzle(
-        size=9,
-        difficulty="hard",
-        path_mode="backbite_v1",
-        seed=42,
-        allow_diagonal=True,
-        structural_repair_enabled=False,
-    )
+@pytest.fixture(scope="module")
+def seed42_hard_gp(puzzle_cache):
+    """The seed-42 hard puzzle, generated once per session (read-only)."""
+    gp = get_puzzle(puzzle_cache, **SEED42_HARD_KWARGS)
     assert gp is not None
+    return gp
+
+
+@pytest.fixture(scope="module")
+def seed42_hard_puzzle(seed42_hard_gp):
+    """Puzzle rebuilt from the seed-42 givens (read-only)."""
+    return _build_puzzle_from_generated(seed42_hard_gp)
 
+
+def test_seed42_hard_density(seed42_hard_gp):
     # Density should be reasonable for hard (lenient bounds to avoid flakiness across small changes)
-    density = gp.clue_count / len(gp.solution)
+    density = seed42_hard_gp.clue_count / len(seed42_hard_gp.solution)
     assert 0.30 <= density <= 0.50
 
-    # Max gap constraint
-    puzzle = _build_puzzle_from_generated(gp)
-    max_gap = _compute_anchor_dispersion(puzzle)
-    assert max_gap <= 12
 
-    # Quartile coverage
-    given_values = sorted([v for _, _, v in gp.givens])
-    min_v, max_v = 1, len(gp.solution)
+def test_seed42_hard_max_gap(seed42_hard_puzzle):
+    assert _compute_anchor_dispersion(seed42_hard_puzzle) <= 12
+
+
+def test_seed42_hard_quartile_coverage(seed42_hard_gp):
+    min_v, max_v = 1, len(seed42_hard_gp.solution)
     span = max_v - min_v + 1
-    quartiles = [
-        (min_v, min_v + span // 4),
-        (min_v + span // 4 + 1, min_v + span // 2),
-        (min_v + span // 2 + 1, min_v + 3 * span // 4),
-        (min_v + 3 * span // 4 + 1, max_v),
-    ]
-    assert all(any(qs <= v <= qe for v in given_values) for (qs, qe) in quartiles)
+    # Inclusive upper bounds of the first three quartiles; bisect maps each
+    # given value straight to its quartile index in one pass
+    edges = (min_v + span // 4, min_v + span // 2, min_v + 3 * span // 4)
+    quartiles_hit = {bisect_left(edges, v) for _, _, v in seed42_hard_gp.givens}
+    assert quartiles_hit == {0, 1, 2, 3}
 
+
+def test_seed42_hard_dispersion(seed42_hard_gp):
     # Spatial dispersion: clues across most rows/cols
-    rows = {r for r, _, _ in gp.givens}
-    cols = {c for _, c, _ in gp.givens}
+    rows = {r for r, _, _ in seed42_hard_gp.givens}
+    cols = {c for _, c, _ in seed42_hard_gp.givens}
     assert len(rows) >= 7 and len(cols) >= 7
 
+
+def test_seed42_hard_uniqueness_verified(seed42_hard_gp):
     # Pipeline verified uniqueness in generation result
-    assert getattr(gp, "uniqueness_verified", False) is True
+    assert getattr(seed42_hard_gp, "uniqueness_verified", False) is True
+
 
-    # Classic counter should not find 2+ solutions within budget
+def test_seed42_classic_counter_finds_unique(seed42_hard_puzzle):
+    # Classic counter should not find 2+ solutions within budget (up to 10s)
     from generate.uniqueness import count_solutions
-    classic = count_solutions(puzzle, cap=2, node_cap=20000, timeout_ms=10000)
+    classic = count_solutions(seed42_hard_puzzle, cap=2, node_cap=20000, timeout_ms=10000)
     assert classic.solutions_found < 2
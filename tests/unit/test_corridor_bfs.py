@@ -6,6 +6,14 @@ from core.grid import Grid
 from core.constraints import Constraints
 from core.puzzle import Puzzle
 from solve.corridors import CorridorMap
+from tests.util.puzzle_factory import strip_puzzle
+
+
+@pytest.fixture
+def corridor_env(puzzle_3x3_8):
+    """3x3 diagonal puzzle with givens 1 and 9 at opposite corners, plus a fresh CorridorMap."""
+    puzzle_3x3_8.grid.set_givens([(0, 0, 1), (2, 2, 9)])
+    return puzzle_3x3_8, CorridorMap()
 
 
 def test_corridor_distance_sum_simple():
@@ -33,19 +41,9 @@ def test_corridor_distance_sum_simple():
     assert Position(4, 4) not in corridor
 
 
-def test_corridor_empty_cells_only():
+def test_corridor_empty_cells_only(corridor_env):
     """Corridor should contain only empty positions, not the anchors."""
-    grid = Grid(3, 3, allow_diagonal=True)
-    constraints = Constraints(1, 9, '8')
-    puzzle = Puzzle(grid, constraints)
-    
-    # Set givens
-    grid.set_cell_value(Position(0, 0), 1)
-    grid.get_cell(Position(0, 0)).given = True
-    grid.set_cell_value(Position(2, 2), 9)
-    grid.get_cell(Position(2, 2)).given = True
-    
-    corridors = CorridorMap()
+    puzzle, corridors = corridor_env
     corridor = corridors.compute_corridor(1, 9, puzzle)
     
     # Anchors should not be in corridor
@@ -60,16 +58,8 @@ def test_corridor_empty_cells_only():
 
 def test_corridor_inequality_threshold():
     """Verify distance-sum uses <= (t-1) not < or <=t."""
-    # 5x1 horizontal strip with 1 at left, 5 at right
-    grid = Grid(5, 1, allow_diagonal=False)  # 5 rows, 1 col for horizontal strip
-    constraints = Constraints(1, 5, '4')  # 4-adjacency for horizontal strip
-    puzzle = Puzzle(grid, constraints)
-    
-    # Set givens (rows go down, so use different positions)
-    grid.set_cell_value(Position(0, 0), 1)
-    grid.get_cell(Position(0, 0)).given = True
-    grid.set_cell_value(Position(4, 0), 5)
-    grid.get_cell(Position(4, 0)).given = True
+    # 5x1 strip (5 rows, 1 col, 4-adjacency) with 1 at the top, 5 at the bottom
+    puzzle = strip_puzzle(5, givens={(0, 0): 1, (4, 0): 5})
     
     corridors = CorridorMap()
     corridor = corridors.compute_corridor(1, 5, puzzle)
@@ -85,19 +75,9 @@ def test_corridor_inequality_threshold():
     assert Position(2, 0) in corridor or Position(1, 0) in corridor or Position(3, 0) in corridor
 
 
-def test_corridor_cache_lifecycle():
+def test_corridor_cache_lifecycle(corridor_env):
     """Corridor cache should invalidate on placement and be marked clean after compute."""
-    grid = Grid(3, 3, allow_diagonal=True)
-    constraints = Constraints(1, 9, '8')
-    puzzle = Puzzle(grid, constraints)
-    
-    # Set both givens so corridor can be computed
-    grid.set_cell_value(Position(0, 0), 1)
-    grid.get_cell(Position(0, 0)).given = True
-    grid.set_cell_value(Position(2, 2), 9)
-    grid.get_cell(Position(2, 2)).given = True
-    
-    corridors = CorridorMap()
+    puzzle, corridors = corridor_env
     
     # First computation should build cache
     corridor1 = corridors.compute_corridor(1, 9, puzzle)
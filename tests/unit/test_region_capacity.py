@@ -6,18 +6,17 @@ from core.grid import Grid
 from core.constraints import Constraints
 from core.puzzle import Puzzle
 from solve.regions import RegionCache
+from tests.util.puzzle_factory import strip_puzzle
 
 
-def test_region_capacity_basic():
+def test_region_capacity_basic(puzzle_3x3_8):
     """Region capacity should count empty cells in connected components."""
     # 3x3 with middle row filled (splits top and bottom regions)
-    grid = Grid(3, 3, allow_diagonal=True)
-    constraints = Constraints(1, 9, '8')
-    puzzle = Puzzle(grid, constraints)
+    puzzle = puzzle_3x3_8
+    grid = puzzle.grid
     
     # Fill middle row to split into regions
-    for col in range(3):
-        grid.set_cell_value(Position(1, col), 99)
+    grid.set_values((1, col, 99) for col in range(3))
     
     regions = RegionCache()
     regions.build_regions(puzzle)
@@ -47,16 +46,8 @@ def test_region_intersecting_corridor():
 
 def test_region_insufficient_capacity():
     """If a region has fewer empties than (t-1), gap cannot fit."""
-    # 5x1 strip with middle 3 empty, but we need gap of 5
-    grid = Grid(5, 1, allow_diagonal=False)  # 5 rows, 1 col
-    constraints = Constraints(1, 25, '4')
-    puzzle = Puzzle(grid, constraints)
-    
-    # Fill first and last cells
-    grid.set_cell_value(Position(0, 0), 1)
-    grid.get_cell(Position(0, 0)).given = True
-    grid.set_cell_value(Position(4, 0), 21)
-    grid.get_cell(Position(4, 0)).given = True
+    # 5x1 strip (values 1..25) with first and last cells given, middle 3 empty
+    puzzle = strip_puzzle(5, max_value=25, givens={(0, 0): 1, (4, 0): 21})
     
     regions = RegionCache()
     regions.build_regions(puzzle)
@@ -11,19 +11,16 @@ from core.cell import Cell
 from core.constraints import Constraints
 from core.puzzle import Puzzle
 from solve.solver import Solver, validate_solution
+from tests.util.puzzle_factory import blank_puzzle
 
 
 class TestSolverEdgeCases:
     """Test solver behavior with edge cases."""
     
-    def test_empty_puzzle_unsolved(self):
+    def test_empty_puzzle_unsolved(self, puzzle_3x3_8):
         """Test that empty puzzle returns unsolved."""
-        grid = Grid(3, 3, allow_diagonal=True)
-        constraints = Constraints(1, 9, '8')
-        puzzle = Puzzle(grid, constraints)
-        
         # No givens - completely empty
-        result = Solver.solve(puzzle, mode='logic_v0')
+        result = Solver.solve(puzzle_3x3_8, mode='logic_v0')
         
         # Should not solve (no information to work with)
         assert not result.solved
@@ -95,97 +92,59 @@ class TestSolverEdgeCases:
         assert result.solved
         assert len(result.steps) == 0  # No steps needed
     
-    def test_v3_with_timeout(self):
-        """Test that v3 respects timeout settings."""
-        grid = Grid(5, 5, allow_diagonal=True)
-        constraints = Constraints(1, 25, '8')
-        puzzle = Puzzle(grid, constraints)
-        
-        # Set only one given (very hard puzzle)
-        grid.set_cell_value(Position(0, 0), 1)
-        grid.get_cell(Position(0, 0)).given = True
-        
-        # Should respect very short timeout
-        result = Solver.solve(puzzle, mode='logic_v3', timeout_ms=1)
-        
-        # Likely won't solve in 1ms
-        # Just verify it doesn't crash or hang
-        assert isinstance(result.solved, bool)
-    
-    def test_v3_with_node_limit(self):
-        """Test that v3 respects node limit."""
-        grid = Grid(5, 5, allow_diagonal=True)
-        constraints = Constraints(1, 25, '8')
-        puzzle = Puzzle(grid, constraints)
-        
-        # Set minimal givens
-        grid.set_cell_value(Position(0, 0), 1)
-        grid.get_cell(Position(0, 0)).given = True
+    @pytest.mark.parametrize("limits, within_limits", [
+        # Likely won't solve in 1ms; just verify it doesn't crash or hang
+        pytest.param(dict(timeout_ms=1), lambda r: isinstance(r.solved, bool), id="timeout"),
+        # Should stop before solving due to node limit
+        pytest.param(dict(max_nodes=5), lambda r: not r.solved or r.nodes <= 5, id="node_limit"),
+    ])
+    def test_v3_respects_search_limits(self, limits, within_limits):
+        """Test that v3 respects timeout and node-limit settings."""
+        # Only one given (very hard puzzle)
+        puzzle = blank_puzzle(5, givens={(0, 0): 1})
         
-        # Set very low node limit
-        result = Solver.solve(puzzle, mode='logic_v3', max_nodes=5)
+        result = Solver.solve(puzzle, mode='logic_v3', **limits)
         
-        # Should stop before solving due to node limit
-        assert not result.solved or result.nodes <= 5
+        assert within_limits(result)
+
+
+# name -> ((rows, cols, allow_diagonal), filled {(row, col): value},
+#          original givens, expected report subset); values range over 1..rows*cols
+VALIDATION_CASES = {
+    "empty_puzzle": (
+        (3, 3, True), {}, {},
+        {'status': 'FAIL', 'all_filled': False},
+    ),
+    "partially_filled": (
+        (3, 1, False), {(0, 0): 1}, {Position(0, 0): 1},
+        {'status': 'FAIL', 'all_filled': False},
+    ),
+    "duplicate_values": (
+        (3, 1, False), {(0, 0): 1, (1, 0): 1, (2, 0): 3}, {Position(0, 0): 1},
+        {'status': 'FAIL', 'values_complete': False},
+    ),
+    # Single cell is always contiguous
+    "single_cell": (
+        (1, 1, False), {(0, 0): 1}, {Position(0, 0): 1},
+        {'status': 'PASS', 'contiguous_path': True},
+    ),
+}
 
 
 class TestValidationEdgeCases:
     """Test validation with edge cases."""
     
-    def test_validate_empty_puzzle(self):
-        """Test validation of empty puzzle."""
-        grid = Grid(3, 3, allow_diagonal=True)
-        constraints = Constraints(1, 9, '8')
-        puzzle = Puzzle(grid, constraints)
-        
-        report = validate_solution(puzzle, {})
+    @pytest.mark.parametrize("case", list(VALIDATION_CASES))
+    def test_validate(self, case):
+        """validate_solution reports the expected status and failing check."""
+        (rows, cols, diagonal), filled, givens, expected = VALIDATION_CASES[case]
+        grid = Grid(rows, cols, allow_diagonal=diagonal)
+        grid.set_values((r, c, value) for (r, c), value in filled.items())
+        puzzle = Puzzle(grid, Constraints(1, rows * cols, '8' if diagonal else '4'))
         
-        assert report['status'] == 'FAIL'
-        assert not report['all_filled']
-    
-    def test_validate_partially_filled(self):
-        """Test validation of partially filled puzzle."""
-        grid = Grid(3, 1, allow_diagonal=False)
-        constraints = Constraints(1, 3, '4')
-        puzzle = Puzzle(grid, constraints)
+        report = validate_solution(puzzle, givens)
         
-        # Fill only first cell
-        grid.set_cell_value(Position(0, 0), 1)
-        
-        report = validate_solution(puzzle, {Position(0, 0): 1})
-        
-        assert report['status'] == 'FAIL'
-        assert not report['all_filled']
-    
-    def test_validate_with_duplicate_values(self):
-        """Test validation detects duplicate values."""
-        grid = Grid(3, 1, allow_diagonal=False)
-        constraints = Constraints(1, 3, '4')
-        puzzle = Puzzle(grid, constraints)
-        
-        # Create duplicate
-        grid.set_cell_value(Position(0, 0), 1)
-        grid.set_cell_value(Position(1, 0), 1)  # Duplicate!
-        grid.set_cell_value(Position(2, 0), 3)
-        
-        report = validate_solution(puzzle, {Position(0, 0): 1})
-        
-        assert report['status'] == 'FAIL'
-        assert not report['values_complete']
-    
-    def test_validate_single_cell_puzzle(self):
-        """Test validation of 1x1 puzzle."""
-        grid = Grid(1, 1, allow_diagonal=False)
-        constraints = Constraints(1, 1, '4')
-        puzzle = Puzzle(grid, constraints)
-        
-        grid.set_cell_value(Position(0, 0), 1)
-        
-        report = validate_solution(puzzle, {Position(0, 0): 1})
-        
-        # Single cell is always contiguous
-        assert report['status'] == 'PASS'
-        assert report['contiguous_path']
+        assert {key: report[key] for key in expected} == expected
 
 
 class TestModeTransitions:
@@ -214,15 +173,8 @@ class TestModeTransitions:
     
     def test_v2_after_v0_unsolved(self):
         """Test using v2 after v0 fails."""
-        grid = Grid(5, 5, allow_diagonal=True)
-        constraints = Constraints(1, 25, '8')
-        puzzle = Puzzle(grid, constraints)
-        
         # Set some givens (not enough for v0/v2 alone)
-        grid.set_cell_value(Position(0, 0), 1)
-        grid.get_cell(Position(0, 0)).given = True
-        grid.set_cell_value(Position(4, 4), 25)
-        grid.get_cell(Position(4, 4)).given = True
+        puzzle = blank_puzzle(5, givens={(0, 0): 1, (4, 4): 25})
         
         result_v0 = Solver.solve(puzzle, mode='logic_v0')
         result_v2 = Solver.solve(puzzle, mode='logic_v2')
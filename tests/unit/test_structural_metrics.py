@@ -33,10 +33,51 @@ def test_build_structural_metrics_computes_distributions():
     )
     metrics = build_structural_metrics(inputs)
 
-    assert metrics['givens']['total'] == len(givens)
-    assert metrics['givens']['row_counts'][0] == 1
-    assert metrics['givens']['row_counts'][1] == 1
-    assert metrics['anchors']['count'] == 3
-    assert metrics['anchors']['gaps']['min'] == 1
-    assert metrics['branching']['average_branching_factor'] == round(20 / 4, 4)
-    assert metrics['branching']['search_ratio'] == round(1 - solver_metrics['logic_ratio'], 4)
+    assert metrics == {
+        'givens': {
+            'total': len(givens),
+            'density': len(givens) / (size * size),
+            'row_counts': [1, 1, 0],
+            'column_counts': [1, 0, 1],
+            'quadrants': {'top_left': 1, 'top_right': 1, 'bottom_left': 0, 'bottom_right': 0},
+        },
+        'anchors': {
+            'count': 3,
+            'density': 0.6,
+            'gaps': {'min': 1, 'max': 2, 'avg': 1.5},
+        },
+        'branching': {
+            'average_branching_factor': round(20 / 4, 4),
+            'search_ratio': round(1 - solver_metrics['logic_ratio'], 4),
+            'nodes': 20,
+            'depth': 4,
+            'steps': 10,
+        },
+    }
+
+
+def test_givens_quadrants_split_odd_grid_middle_top_left():
+    """On odd grids the middle row/column counts toward the top/left quadrants."""
+    from generate.metrics import _compute_givens_distribution
+
+    givens = [(2, 2, 1), (0, 4, 2), (3, 0, 3), (4, 3, 4), (4, 4, 5)]
+    distribution = _compute_givens_distribution(5, givens)
+
+    assert distribution['quadrants'] == {
+        'top_left': 1,
+        'top_right': 1,
+        'bottom_left': 1,
+        'bottom_right': 2,
+    }
+    assert list(distribution['quadrants']) == ['top_left', 'top_right', 'bottom_left', 'bottom_right']
+
+
+def test_anchor_spacing_ignores_duplicate_and_off_path_anchors():
+    """Anchors are deduplicated, ordered by path index, and off-path ones dropped."""
+    from generate.metrics import _compute_anchor_spacing
+
+    path = [Position(0, c) for c in range(5)]
+    spacing = _compute_anchor_spacing(path, [(0, 4), (0, 0), (0, 4), (3, 3), (0, 1)])
+
+    assert spacing['count'] == 3
+    assert spacing['gaps'] == {'min': 1, 'max': 3, 'avg': 2}
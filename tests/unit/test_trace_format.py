@@ -10,31 +10,45 @@ from solve.solver import SolverStep
 from util.trace import TraceFormatter, format_steps_summary
 
 
+def _steps(rows):
+    """SolverSteps from (row, col, value, reason) tuples, with interned positions."""
+    return [SolverStep(Position(r, c), value, reason) for r, c, value, reason in rows]
+
+
+# TraceFormatter only stores its options, so one instance per configuration
+# serves every test in the module
+@pytest.fixture(scope="module")
+def fmt():
+    return TraceFormatter()
+
+
+@pytest.fixture(scope="module")
+def fmt_grouped():
+    return TraceFormatter(group_similar=True)
+
+
 class TestTraceFormatter:
     """Test trace formatting utilities."""
     
-    def test_format_single_step(self):
+    def test_format_single_step(self, fmt):
         """Test formatting a single solver step."""
         step = SolverStep(Position(0, 1), 5, "Only possible value for this cell")
-        formatter = TraceFormatter()
-        
-        formatted = formatter.format_step(step)
+        formatted = fmt.format_step(step)
         
         assert "5" in formatted
         assert "(1, 2)" in formatted or "0, 1" in formatted  # Position format may vary
         assert "Only possible value" in formatted
     
-    def test_format_multiple_steps_with_grouping(self):
+    def test_format_multiple_steps_with_grouping(self, fmt_grouped):
         """Test grouping similar steps for concise output."""
-        steps = [
-            SolverStep(Position(0, 0), 1, "Given"),
-            SolverStep(Position(0, 1), 2, "Only possible value for this cell"),
-            SolverStep(Position(0, 2), 3, "Only possible value for this cell"),
-            SolverStep(Position(1, 0), 4, "Only possible position for this value"),
-        ]
+        steps = _steps([
+            (0, 0, 1, "Given"),
+            (0, 1, 2, "Only possible value for this cell"),
+            (0, 2, 3, "Only possible value for this cell"),
+            (1, 0, 4, "Only possible position for this value"),
+        ])
         
-        formatter = TraceFormatter(group_similar=True)
-        summary = formatter.format_steps(steps)
+        summary = fmt_grouped.format_steps(steps)
         
         # Should group similar reasoning and show counts
         assert "Only possible value" in summary
@@ -42,24 +56,20 @@ class TestTraceFormatter:
         assert "Given" in summary
         assert "Only possible position" in summary
     
-    def test_format_pruning_steps(self):
+    def test_format_pruning_steps(self, fmt):
         """Test formatting pruning/elimination steps."""
         step = SolverStep(Position(2, 3), 15, "Eliminated by corridor bridging: distance-sum inequality")
-        formatter = TraceFormatter()
-        
-        formatted = formatter.format_step(step)
+        formatted = fmt.format_step(step)
         
         assert "corridor" in formatted.lower()
         assert "15" in formatted
         # Position (2,3) is 0-indexed, formats as (3, 4) in 1-indexed display
         assert "(3, 4)" in formatted
     
-    def test_format_search_steps(self):
+    def test_format_search_steps(self, fmt):
         """Test formatting search decision steps."""
         step = SolverStep(Position(1, 1), 7, "Search guess: value 7 at Position(1, 1), depth 3")
-        formatter = TraceFormatter()
-        
-        formatted = formatter.format_step(step)
+        formatted = fmt.format_step(step)
         
         assert "7" in formatted
         assert "search" in formatted.lower() or "guess" in formatted.lower()
@@ -67,10 +77,11 @@ class TestTraceFormatter:
     
     def test_limit_trace_lines(self):
         """Test limiting trace output to reasonable length."""
-        # Create many steps
+        # Just past max_lines is enough to trigger truncation; format_steps
+        # needs len(), so this stays a list, but with a shared reason string
         steps = [
-            SolverStep(Position(i % 5, i // 5), i + 1, f"Step {i}")
-            for i in range(300)
+            SolverStep(Position(i % 5, i // 5), i + 1, "Step")
+            for i in range(205)
         ]
         
         formatter = TraceFormatter(max_lines=200)
@@ -90,11 +101,11 @@ class TestStepsSummary:
     
     def test_format_steps_summary_basic(self):
         """Test basic summary formatting."""
-        steps = [
-            SolverStep(Position(0, 0), 1, "Given"),
-            SolverStep(Position(0, 1), 2, "Only possible value"),
-            SolverStep(Position(0, 2), 3, "Only possible position"),
-        ]
+        steps = _steps([
+            (0, 0, 1, "Given"),
+            (0, 1, 2, "Only possible value"),
+            (0, 2, 3, "Only possible position"),
+        ])
         
         summary = format_steps_summary(steps)
         
@@ -104,13 +115,13 @@ class TestStepsSummary:
     
     def test_format_steps_summary_by_strategy(self):
         """Test grouping summary by strategy."""
-        steps = [
-            SolverStep(Position(0, 0), 1, "Given"),
-            SolverStep(Position(0, 1), 2, "Only possible value for this cell"),
-            SolverStep(Position(0, 2), 3, "Only possible value for this cell"),
-            SolverStep(Position(1, 0), 4, "Only possible position for this value"),
-            SolverStep(Position(1, 1), 5, "Search guess: value 5 at Position(1, 1), depth 1"),
-        ]
+        steps = _steps([
+            (0, 0, 1, "Given"),
+            (0, 1, 2, "Only possible value for this cell"),
+            (0, 2, 3, "Only possible value for this cell"),
+            (1, 0, 4, "Only possible position for this value"),
+            (1, 1, 5, "Search guess: value 5 at Position(1, 1), depth 1"),
+        ])
         
         summary = format_steps_summary(steps, group_by_strategy=True)
         
@@ -0,0 +1,19 @@
+"""Shared cache of generated puzzles for expensive integration tests."""
+from generate.generator import Generator
+
+
+def get_puzzle(cache: dict, **kwargs):
+    """
+    Return Generator.generate_puzzle(**kwargs), generating at most once per key.
+
+    Args:
+        cache: Dict owned by the session-scoped ``puzzle_cache`` fixture
+        **kwargs: Arguments forwarded to Generator.generate_puzzle
+
+    Returns:
+        The (shared) generated puzzle; callers must treat it as read-only
+    """
+    key = tuple(sorted(kwargs.items()))
+    if key not in cache:
+        cache[key] = Generator.generate_puzzle(**kwargs)
+    return cache[key]
@@ -0,0 +1,53 @@
+"""Blank puzzle templates shared by tests that build puzzles by hand."""
+import copy
+
+from core.constraints import Constraints
+from core.grid import Grid
+from core.puzzle import Puzzle
+
+# (rows, cols, allow_diagonal, max_value) -> blank template; never handed out directly
+_TEMPLATES = {}
+
+
+def _from_template(rows: int, cols: int, allow_diagonal: bool, max_value: int, givens) -> Puzzle:
+    key = (rows, cols, allow_diagonal, max_value)
+    template = _TEMPLATES.get(key)
+    if template is None:
+        grid = Grid(rows=rows, cols=cols, allow_diagonal=allow_diagonal)
+        constraints = Constraints(min_value=1, max_value=max_value, allow_diagonal=allow_diagonal)
+        template = _TEMPLATES[key] = Puzzle(grid=grid, constraints=constraints)
+
+    puzzle = Puzzle(grid=template.grid.clone(), constraints=copy.copy(template.constraints))
+    if givens:
+        puzzle.grid.set_givens((r, c, value) for (r, c), value in givens.items())
+    return puzzle
+
+
+def blank_puzzle(size: int, allow_diagonal: bool = True, givens=None) -> Puzzle:
+    """
+    Return a fresh size x size puzzle (values 1..size^2) cloned from a cached template.
+
+    Args:
+        size: Grid size
+        allow_diagonal: Adjacency mode for grid and constraints
+        givens: Optional {(row, col): value} placed as givens on the copy
+
+    Returns:
+        A new Puzzle (grid and constraints copied) the caller may mutate freely
+    """
+    return _from_template(size, size, allow_diagonal, size * size, givens)
+
+
+def strip_puzzle(length: int, max_value: int = None, givens=None) -> Puzzle:
+    """
+    Return a fresh length x 1 strip puzzle (4-adjacency) cloned from a cached template.
+
+    Args:
+        length: Number of rows in the single-column strip
+        max_value: Largest value (defaults to length)
+        givens: Optional {(row, col): value} placed as givens on the copy
+
+    Returns:
+        A new Puzzle (grid and constraints copied) the caller may mutate freely
+    """
+    return _from_template(length, 1, False, max_value or length, givens)
@@ -5,41 +5,98 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from generate.difficulty_levels import DifficultyThresholds, assign_intermediate_level
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
 
-def _percentile(values: List[float], pct: float) -> float:
-    """Return the interpolated percentile for a sorted list."""
+
+def _percentiles(values: List[float], pcts: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Return interpolated percentiles for each fraction in pcts, sorting once."""
     if not values:
-        return 0.0
+        return tuple(0.0 for _ in pcts)
     values = sorted(values)
-    k = (len(values) - 1) * pct
-    f = int(k)
-    c = min(f + 1, len(values) - 1)
-    if f == c:
-        return values[f]
-    return values[f] * (c - k) + values[c] * (k - f)
+    last = len(values) - 1
+    result = []
+    for pct in pcts:
+        k = last * pct
+        f = int(k)
+        c = min(f + 1, last)
+        result.append(values[f] if f == c else values[f] * (c - k) + values[c] * (k - f))
+    return tuple(result)
 
 
-def _load_scores(puzzles_dir: Path) -> Dict[str, List[float]]:
-    """Load difficulty_score_1 values keyed by difficulty."""
+# Top-level keys as the pack exporter writes them (json.dumps(indent=2) puts
+# them at exactly two spaces; nested keys sit deeper and never match)
+_DIFFICULTY_RE = re.compile(rb'^  "difficulty": ("(?:[^"\\]|\\.)*"),?\r?$', re.M)
+_SCORE_RE = re.compile(rb'^  "difficulty_score_1": (-?[0-9][0-9.eE+-]*),?\r?$', re.M)
+
+
+def _read_json(path: Path) -> Dict:
+    return _loads(path.read_bytes())
+
+
+def _read_score_fields(path: Path) -> Tuple[Optional[str], Optional[float]]:
+    """Return (difficulty, difficulty_score_1) without decoding the whole file.
+
+    Falls back to a full parse when the file is not in the exporter's
+    indented layout or either field is missing/null.
+    """
+    raw = path.read_bytes()
+    label = _DIFFICULTY_RE.search(raw)
+    score = _SCORE_RE.search(raw)
+    if label and score:
+        return _loads(label.group(1)), _loads(score.group(1))
+    data = _loads(raw)
+    return data.get("difficulty"), data.get("difficulty_score_1")
+
+
+def _iter_puzzles(puzzles_dir: Path, read: Callable[[Path], object] = _read_json) -> Iterator[Tuple[Path, object]]:
+    """Yield (path, read(path)) for every puzzle file in sorted order.
+
+    Files are read and parsed on a thread pool so disk reads overlap;
+    results still come back in path order.
+    """
+    files = sorted(puzzles_dir.glob("*.json"))
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        yield from zip(files, pool.map(read, files))
+
+
+def _group_scores(fields: Iterable[Tuple[Optional[str], Optional[float]]]) -> Dict[str, List[float]]:
+    """Collect difficulty_score_1 values keyed by difficulty."""
     scores: Dict[str, List[float]] = {}
-    for puzzle_file in sorted(puzzles_dir.glob("*.json")):
-        data = json.loads(puzzle_file.read_text(encoding="utf-8"))
-        label = data.get("difficulty")
-        score = data.get("difficulty_score_1")
+    for label, score in fields:
         if label and score is not None:
             scores.setdefault(label, []).append(score)
     return scores
 
 
-def _apply_levels(puzzles_dir: Path, thresholds: DifficultyThresholds) -> None:
+def _load_scores(puzzles_dir: Path) -> Dict[str, List[float]]:
+    """Load difficulty_score_1 values keyed by difficulty (score fields only)."""
+    return _group_scores(fields for _, fields in _iter_puzzles(puzzles_dir, _read_score_fields))
+
+
+def _load_puzzles(puzzles_dir: Path) -> Tuple[Dict[str, List[float]], List[Tuple[Path, Dict]]]:
+    """Parse every puzzle once; return the scores and the (path, data) pairs for rewriting."""
+    puzzles = list(_iter_puzzles(puzzles_dir))
+    scores = _group_scores((data.get("difficulty"), data.get("difficulty_score_1")) for _, data in puzzles)
+    return scores, puzzles
+
+
+def _apply_levels(puzzles: List[Tuple[Path, Dict]], thresholds: DifficultyThresholds) -> None:
     """Rewrite puzzles with updated intermediate levels."""
-    for puzzle_file in sorted(puzzles_dir.glob("*.json")):
-        data = json.loads(puzzle_file.read_text(encoding="utf-8"))
+    # Rewrites keep the stdlib encoder so files match the generator's
+    # json.dumps(indent=2) layout
+    for puzzle_file, data in puzzles:
         label = data.get("difficulty")
         score = data.get("difficulty_score_1")
         if label is None or score is None:
@@ -69,15 +126,18 @@ def main() -> int:
     if not puzzles_dir.exists():
         raise SystemExit(f"No puzzles/ directory at {puzzles_dir}")
 
-    scores = _load_scores(puzzles_dir)
+    # --apply needs the full documents anyway, so parse them once up front;
+    # a report-only run just pulls the two score fields
+    if args.apply:
+        scores, puzzles = _load_puzzles(puzzles_dir)
+    else:
+        scores = _load_scores(puzzles_dir)
     if not scores:
         raise SystemExit("No difficulty_score_1 values found.")
 
     summary: Dict[str, Tuple[float, float]] = {}
     for label, values in scores.items():
-        p33 = _percentile(values, 0.33)
-        p66 = _percentile(values, 0.66)
-        summary[label] = (p33, p66)
+        summary[label] = _percentiles(values, (0.33, 0.66))
 
     print("Difficulty split percentiles:")
     for label, (p33, p66) in summary.items():
@@ -88,7 +148,7 @@ def main() -> int:
             classic=summary.get("classic", DifficultyThresholds().classic),
             expert=summary.get("expert", DifficultyThresholds().expert),
         )
-        _apply_levels(puzzles_dir, thresholds)
+        _apply_levels(puzzles, thresholds)
         print("Updated intermediate_level fields using the new thresholds.")
 
     return 0
@@ -2,14 +2,22 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 try:
     from streamlit_plotly_events import plotly_events
 
@@ -18,6 +26,13 @@ except ImportError:
     plotly_events = None
     HAS_INTERACTIVE_SCATTER = False
 
+try:
+    import pyarrow  # noqa: F401  (parquet engine for the metrics sidecar cache)
+
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
 
 st.set_page_config(page_title="Pack Metrics Explorer", layout="wide")
 
@@ -46,41 +61,86 @@ ANALYSIS_TIPS = [
 ]
 
 
-def flatten_dict(data: Dict, prefix: str = "", sep: str = ".") -> Dict[str, object]:
-    """Flatten nested dicts using dot-notation keys."""
-    items = []
-    for key, value in data.items():
-        new_key = f"{prefix}{sep}{key}" if prefix else key
-        if isinstance(value, dict):
-            items.extend(flatten_dict(value, new_key, sep=sep).items())
-        else:
-            items.append((new_key, value))
-    return dict(items)
-
-
-def _extract_record(puzzle_data: Dict) -> Dict:
-    """Extract a single row of metrics from a puzzle JSON blob."""
-    record = {
-        "puzzle_id": puzzle_data.get("id"),
-        "pack_id": puzzle_data.get("pack_id"),
-        "size": puzzle_data.get("size"),
-        "difficulty": puzzle_data.get("difficulty"),
-        "clue_count": puzzle_data.get("clue_count"),
-        "seed": puzzle_data.get("seed"),
-        "difficulty_score_1": puzzle_data.get("difficulty_score_1"),
-        "difficulty_score_2": puzzle_data.get("difficulty_score_2"),
-        "intermediate_level": puzzle_data.get("intermediate_level"),
-        "intermediate_level": puzzle_data.get("intermediate_level"),
-    }
+# DataFrame column -> top-level puzzle JSON key; flattened metrics follow these
+RECORD_FIELDS = {
+    "puzzle_id": "id",
+    "pack_id": "pack_id",
+    "size": "size",
+    "difficulty": "difficulty",
+    "clue_count": "clue_count",
+    "seed": "seed",
+    "difficulty_score_1": "difficulty_score_1",
+    "difficulty_score_2": "difficulty_score_2",
+    "intermediate_level": "intermediate_level",
+}
+
+
+# Flattened frames are cached per pack under this directory, keyed by the
+# pack path and a signature of its puzzle files
+CACHE_DIR = Path(
+    os.environ.get("METRICS_EXPLORER_CACHE_DIR", Path.home() / ".cache" / "fuzzypuzzy" / "metrics_explorer")
+)
+SOURCE_COLUMN = "_source_file"
+
+
+class PuzzleLookup:
+    """puzzle_id -> puzzle JSON, parsed from the pack file on first access."""
 
-    metrics_block = puzzle_data.get("metrics", {})
-    record.update(flatten_dict(metrics_block))
-    return record
+    def __init__(self, paths: Dict[str, Path], loaded: Optional[Dict[str, Dict]] = None):
+        self._paths = paths
+        self._loaded = dict(loaded or {})
+
+    def get(self, puzzle_id: str) -> Optional[Dict]:
+        if puzzle_id not in self._loaded:
+            path = self._paths.get(puzzle_id)
+            if path is None:
+                return None
+            self._loaded[puzzle_id] = _loads(path.read_bytes())
+        return self._loaded[puzzle_id]
+
+
+def _files_signature(puzzle_files: List[Path]) -> str:
+    """Digest of every file's (name, size, mtime_ns); any rename, swap, or rewrite changes it."""
+    digest = hashlib.sha1()
+    for path in sorted(puzzle_files):
+        stat = path.stat()
+        digest.update(f"{path.name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _cache_file(cache_dir: Path, pack_path: Path, puzzle_files: List[Path]) -> Path:
+    pack_key = hashlib.sha1(str(pack_path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{pack_key}-{_files_signature(puzzle_files)}.parquet"
+
+
+def _write_cache(frame: pd.DataFrame, puzzle_files: List[Path], cache_file: Path) -> None:
+    """Best-effort parquet cache; an unwritable cache dir or unserializable column just skips it."""
+    partial = cache_file.with_suffix(".tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        pack_key = cache_file.name.split("-", 1)[0]
+        for stale in cache_file.parent.glob(f"{pack_key}-*.parquet"):
+            stale.unlink()
+        frame.assign(**{SOURCE_COLUMN: [p.name for p in puzzle_files]}).to_parquet(partial, index=False)
+        # Rename only once complete so a failed write never leaves a readable cache
+        partial.replace(cache_file)
+    except (OSError, TypeError, ValueError, NotImplementedError):
+        partial.unlink(missing_ok=True)
 
 
 @st.cache_data(show_spinner=True)
-def load_pack(pack_dir: str) -> Tuple[Dict, pd.DataFrame, Dict[str, Dict]]:
+def load_pack(pack_dir: str) -> Tuple[Dict, pd.DataFrame, PuzzleLookup]:
     """Load pack metadata and puzzle metrics into a DataFrame."""
+    return _load_pack(pack_dir, CACHE_DIR)
+
+
+def _load_pack(pack_dir: str, cache_dir: Path) -> Tuple[Dict, pd.DataFrame, PuzzleLookup]:
+    """Uncached body of load_pack.
+
+    With pyarrow installed the flattened frame is also saved as parquet under
+    cache_dir and reused until any puzzle file is added, removed, renamed, or
+    rewritten.
+    """
     pack_path = Path(pack_dir)
     metadata_file = pack_path / "metadata.json"
     puzzles_dir = pack_path / "puzzles"
@@ -93,24 +153,39 @@ def load_pack(pack_dir: str) -> Tuple[Dict, pd.DataFrame, Dict[str, Dict]]:
     with metadata_file.open("r", encoding="utf-8") as f:
         metadata = json.load(f)
 
-    rows = []
-    puzzle_lookup: Dict[str, Dict] = {}
-    for puzzle_file in sorted(puzzles_dir.glob("*.json")):
-        with puzzle_file.open("r", encoding="utf-8") as f:
-            data = json.load(f)
-            rows.append(_extract_record(data))
-            puzzle_id = data.get("id")
-            if puzzle_id:
-                puzzle_lookup[puzzle_id] = data
-
-    if not rows:
+    puzzle_files = sorted(puzzles_dir.glob("*.json"))
+    if not puzzle_files:
         raise ValueError(f"No puzzles found in {puzzles_dir}")
 
-    frame = pd.DataFrame(rows)
+    cache_file = _cache_file(cache_dir, pack_path, puzzle_files)
+    if HAS_PARQUET and cache_file.exists():
+        frame = pd.read_parquet(cache_file)
+        sources = frame.pop(SOURCE_COLUMN)
+        paths = {pid: puzzles_dir / name for pid, name in zip(frame["puzzle_id"], sources) if pid}
+        return metadata, frame, PuzzleLookup(paths)
+
+    # Overlap file reads on a thread pool; map keeps the sorted file order
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        records = list(pool.map(lambda path: _loads(path.read_bytes()), puzzle_files))
+
+    paths = {data["id"]: path for path, data in zip(puzzle_files, records) if data.get("id")}
+    loaded = {data["id"]: data for data in records if data.get("id")}
+
+    # Top-level fields column by column, then every metrics block flattened to
+    # dot-notation columns in one json_normalize pass
+    frame = pd.concat(
+        [
+            pd.DataFrame({column: [data.get(key) for data in records] for column, key in RECORD_FIELDS.items()}),
+            pd.json_normalize([data.get("metrics") or {} for data in records], sep="."),
+        ],
+        axis=1,
+    )
     numeric_cols = frame.select_dtypes(include=["number"]).columns
     frame[numeric_cols] = frame[numeric_cols].apply(pd.to_numeric, errors="ignore")
 
-    return metadata, frame, puzzle_lookup
+    if HAS_PARQUET:
+        _write_cache(frame, puzzle_files, cache_file)
+    return metadata, frame, PuzzleLookup(paths, loaded)
 
 
 def sidebar_filters(df: pd.DataFrame) -> pd.DataFrame:
@@ -148,7 +223,7 @@ def sidebar_filters(df: pd.DataFrame) -> pd.DataFrame:
     return filtered
 
 
-def choose_chart(df: pd.DataFrame, puzzle_lookup: Dict[str, Dict], enable_interactive: bool) -> str | None:
+def choose_chart(df: pd.DataFrame, puzzle_lookup: PuzzleLookup, enable_interactive: bool) -> str | None:
     """Render chart controls and display a plotly visualization.
 
     Returns:
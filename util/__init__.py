@@ -1,8 +1,8 @@
 """Utilities package."""
 
-from .rng import RNG
+from .rng import RNG, seeded_random
 from .profiling import Profiling
 from .logging import Logging
 from .config import Config
 
-__all__ = ["RNG", "Profiling", "Logging", "Config"]
+__all__ = ["RNG", "seeded_random", "Profiling", "Logging", "Config"]
@@ -5,6 +5,12 @@ Contains the RNG class for random number utilities.
 import random
 import time
 
+# Initial Mersenne Twister state per seed; restoring a state is cheaper than
+# re-deriving it from the seed, and repeated seeds (tests, retries) are common
+_SEED_STATES = {}
+_SEED_STATES_MAX = 256
+
+
 class RNG:
     """Seeded random number generator for reproducible puzzle generation."""
     
@@ -13,7 +19,7 @@ class RNG:
         if seed is None:
             seed = int(time.time() * 1000) % (2**31)
         self.seed = seed
-        self.rng = random.Random(seed)
+        self.rng = seeded_random(seed)
     
     def randint(self, a, b):
         """Random integer in range [a, b]."""
@@ -34,3 +40,22 @@ class RNG:
     def get_seed(self):
         """Return the current seed."""
         return self.seed
+
+
+def seeded_random(seed):
+    """Return random.Random(seed), restored from a cached state when possible.
+    
+    Only int, str and bytes seeds are memoized; None (fresh entropy) and any
+    other seed always build a new generator.
+    """
+    if seed is None or not isinstance(seed, (int, str, bytes)):
+        return random.Random(seed)
+    state = _SEED_STATES.get(seed)
+    if state is None:
+        rng = random.Random(seed)
+        if len(_SEED_STATES) < _SEED_STATES_MAX:
+            _SEED_STATES[seed] = rng.getstate()
+        return rng
+    rng = random.Random.__new__(random.Random)
+    rng.setstate(state)
+    return rng